@@ -0,0 +1,52 @@
+import importlib
+import math
+from dataclasses import dataclass
+from importlib.util import find_spec
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+Scaler = Callable[[str, int], str]
+
+
+@dataclass(frozen=True)
+class Benchmark(Generic[T]):
+    name: str
+    input_path: Path
+    scale: Scaler
+    setup: Callable[[Path], T]
+    run: Callable[[T], object]
+    max_scale: int = 100
+
+
+BENCHMARKS: list[Benchmark[Any]] = []
+
+
+def register(benchmark: Benchmark[T]) -> Benchmark[T]:
+    BENCHMARKS.append(benchmark)
+    return benchmark
+
+
+def import_if_available(module: str, requirement: str) -> Optional[ModuleType]:
+    if find_spec(requirement) is None:
+        return None
+
+    return importlib.import_module(module)
+
+
+def repeat_lines(text: str, factor: int) -> str:
+    lines = text.strip().split("\n")
+    return "\n".join(lines * factor)
+
+
+def repeat_sections(text: str, factor: int) -> str:
+    sections = text.strip().split("\n\n")
+    return "\n\n".join(sections * factor)
+
+
+def tile_grid(text: str, factor: int) -> str:
+    tiles_per_side = max(1, round(math.sqrt(factor)))
+    rows = text.strip().split("\n")
+    return "\n".join([row * tiles_per_side for row in rows] * tiles_per_side)
@@ -0,0 +1,56 @@
+from pathlib import Path
+
+from bench.benchmark import Benchmark, import_if_available, register, repeat_lines
+from day1 import external
+from day1 import main as day1
+
+vectorised = import_if_available("day1.vectorised", "numpy")
+
+register(Benchmark("day1.part1", day1.INPUT_PATH, repeat_lines, day1.parse, day1.part1))
+register(Benchmark("day1.part2", day1.INPUT_PATH, repeat_lines, day1.parse, day1.part2))
+register(
+    Benchmark(
+        "day1.external.part1",
+        day1.INPUT_PATH,
+        repeat_lines,
+        external.parse,
+        external.part1,
+    )
+)
+register(
+    Benchmark(
+        "day1.external.part2",
+        day1.INPUT_PATH,
+        repeat_lines,
+        external.parse,
+        external.part2,
+    )
+)
+if vectorised is not None:
+    register(
+        Benchmark(
+            "day1.vectorised.parse",
+            day1.INPUT_PATH,
+            repeat_lines,
+            Path,
+            vectorised.parse,
+        )
+    )
+    register(
+        Benchmark(
+            "day1.vectorised.part1",
+            day1.INPUT_PATH,
+            repeat_lines,
+            vectorised.parse,
+            vectorised.part1,
+        )
+    )
+    register(
+        Benchmark(
+            "day1.vectorised.part2",
+            day1.INPUT_PATH,
+            repeat_lines,
+            vectorised.parse,
+            vectorised.part2,
+        )
+    )
@@ -0,0 +1,21 @@
+from bench.benchmark import Benchmark, register, tile_grid
+from day10 import main as day10
+
+register(
+    Benchmark(
+        "day10.calculate_sum_of_measures[Score]",
+        day10.INPUT_PATH,
+        tile_grid,
+        day10.parse,
+        day10.part1,
+    )
+)
+register(
+    Benchmark(
+        "day10.calculate_sum_of_measures[Rating]",
+        day10.INPUT_PATH,
+        tile_grid,
+        day10.parse,
+        day10.part2,
+    )
+)
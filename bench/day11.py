@@ -0,0 +1,21 @@
+from bench.benchmark import Benchmark, register
+from day11 import main as day11
+
+
+def repeat_stones(text: str, factor: int) -> str:
+    # Identical stones are only counted once, so each copy is shifted to new numbers
+    stones = [int(num) for num in text.strip().split(" ")]
+    return " ".join(
+        str(stone + copy * 1_000_003) for copy in range(factor) for stone in stones
+    )
+
+
+register(
+    Benchmark(
+        "day11.get_number_of_stones_after_b_blinks",
+        day11.INPUT_PATH,
+        repeat_stones,
+        day11.parse,
+        day11.part2,
+    )
+)
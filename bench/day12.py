@@ -0,0 +1,23 @@
+from bench.benchmark import Benchmark, register, tile_grid
+from day12 import main as day12
+
+register(
+    Benchmark(
+        "day12.part1",
+        day12.INPUT_PATH,
+        tile_grid,
+        day12.parse,
+        day12.part1,
+        max_scale=10,
+    )
+)
+register(
+    Benchmark(
+        "day12.Region.calculate_num_sides",
+        day12.INPUT_PATH,
+        tile_grid,
+        day12.parse,
+        day12.part2,
+        max_scale=10,
+    )
+)
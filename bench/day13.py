@@ -0,0 +1,23 @@
+from pathlib import Path
+
+from bench.benchmark import Benchmark, register, repeat_sections
+from day13 import main as day13
+
+register(
+    Benchmark(
+        "day13.ClawMachine.get_price",
+        day13.INPUT_PATH,
+        repeat_sections,
+        day13.parse,
+        day13.part2,
+    )
+)
+register(
+    Benchmark(
+        "day13.parse_machines",
+        day13.INPUT_PATH,
+        repeat_sections,
+        Path,
+        day13.parse_machines,
+    )
+)
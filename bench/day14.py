@@ -0,0 +1,13 @@
+from bench.benchmark import Benchmark, register, repeat_lines
+from day14 import main as day14
+
+register(
+    Benchmark(
+        "day14.Robot.step", day14.INPUT_PATH, repeat_lines, day14.parse, day14.part1
+    )
+)
+register(
+    Benchmark(
+        "day14.get_map", day14.INPUT_PATH, repeat_lines, day14.parse, day14.get_map
+    )
+)
@@ -0,0 +1,29 @@
+from bench.benchmark import Benchmark, register
+from day15 import main as day15
+
+
+def repeat_moves(text: str, factor: int) -> str:
+    raw_board, raw_moves = text.strip().split("\n\n")
+    return raw_board + "\n\n" + "\n".join(raw_moves.split("\n") * factor)
+
+
+register(
+    Benchmark(
+        "day15.process_move",
+        day15.INPUT_PATH,
+        repeat_moves,
+        day15.parse,
+        day15.part1,
+        max_scale=10,
+    )
+)
+register(
+    Benchmark(
+        "day15.process_move[widened]",
+        day15.INPUT_PATH,
+        repeat_moves,
+        day15.parse,
+        day15.part2,
+        max_scale=10,
+    )
+)
@@ -0,0 +1,47 @@
+from bench.benchmark import Benchmark, import_if_available, register, repeat_lines
+from day2 import main as day2
+
+vectorised = import_if_available("day2.vectorised", "numpy")
+
+
+def check_all_reports(reports: list[list[int]]) -> list[bool]:
+    return [day2.is_safe(report) for report in reports]
+
+
+def check_all_reports_with_dampener(reports: list[list[int]]) -> list[bool]:
+    return [day2.is_safe_with_dampener(report) for report in reports]
+
+
+register(
+    Benchmark(
+        "day2.is_safe", day2.INPUT_PATH, repeat_lines, day2.parse, check_all_reports
+    )
+)
+register(
+    Benchmark(
+        "day2.is_safe_with_dampener",
+        day2.INPUT_PATH,
+        repeat_lines,
+        day2.parse,
+        check_all_reports_with_dampener,
+    )
+)
+if vectorised is not None:
+    register(
+        Benchmark(
+            "day2.vectorised.is_safe",
+            day2.INPUT_PATH,
+            repeat_lines,
+            vectorised.parse,
+            vectorised.is_safe,
+        )
+    )
+    register(
+        Benchmark(
+            "day2.vectorised.is_safe_with_dampener",
+            day2.INPUT_PATH,
+            repeat_lines,
+            vectorised.parse,
+            vectorised.is_safe_with_dampener,
+        )
+    )
@@ -0,0 +1,18 @@
+from pathlib import Path
+
+from bench.benchmark import Benchmark, register, repeat_lines
+from day3 import main as day3
+from day3 import parallel, streaming
+
+register(Benchmark("day3.part1", day3.INPUT_PATH, repeat_lines, day3.parse, day3.part1))
+register(Benchmark("day3.part2", day3.INPUT_PATH, repeat_lines, day3.parse, day3.part2))
+register(
+    Benchmark(
+        "day3.streaming.parse", day3.INPUT_PATH, repeat_lines, Path, streaming.parse
+    )
+)
+register(
+    Benchmark(
+        "day3.parallel.parse", day3.INPUT_PATH, repeat_lines, Path, parallel.parse
+    )
+)
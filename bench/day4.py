@@ -0,0 +1,44 @@
+from bench.benchmark import Benchmark, import_if_available, register, tile_grid
+from day4 import main as day4
+
+vectorised = import_if_available("day4.vectorised", "numpy")
+
+register(
+    Benchmark(
+        "day4.count_words",
+        day4.INPUT_PATH,
+        tile_grid,
+        day4.parse,
+        day4.part1,
+        max_scale=10,
+    )
+)
+register(
+    Benchmark(
+        "day4.count_xmas_cross_patterns",
+        day4.INPUT_PATH,
+        tile_grid,
+        day4.parse,
+        day4.part2,
+        max_scale=10,
+    )
+)
+if vectorised is not None:
+    register(
+        Benchmark(
+            "day4.vectorised.count_word",
+            day4.INPUT_PATH,
+            tile_grid,
+            vectorised.parse,
+            vectorised.part1,
+        )
+    )
+    register(
+        Benchmark(
+            "day4.vectorised.count_crosses",
+            day4.INPUT_PATH,
+            tile_grid,
+            vectorised.parse,
+            vectorised.part2,
+        )
+    )
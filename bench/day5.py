@@ -0,0 +1,27 @@
+from pathlib import Path
+
+from bench.benchmark import Benchmark, register
+from day5 import main as day5
+from day5 import streaming
+
+
+def repeat_updates(text: str, factor: int) -> str:
+    raw_rules, raw_updates = text.strip().split("\n\n")
+    return raw_rules + "\n\n" + "\n".join(raw_updates.split("\n") * factor)
+
+
+register(
+    Benchmark("day5.part1", day5.INPUT_PATH, repeat_updates, day5.parse, day5.part1)
+)
+register(
+    Benchmark("day5.part2", day5.INPUT_PATH, repeat_updates, day5.parse, day5.part2)
+)
+register(
+    Benchmark(
+        "day5.streaming.check_updates",
+        day5.INPUT_PATH,
+        repeat_updates,
+        Path,
+        streaming.parse,
+    )
+)
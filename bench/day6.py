@@ -0,0 +1,48 @@
+from typing import Callable
+
+from bench.benchmark import Benchmark, register, repeat_sections
+from day6 import main as day6
+from day6 import parallel
+
+
+# A tiled map would not scale the work, since its single guard leaves the first tile
+def for_each_map(solve: Callable[[str], int]) -> Callable[[str], int]:
+    def solve_all(maps_str: str) -> int:
+        return sum(solve(map_str) for map_str in maps_str.split("\n\n"))
+
+    return solve_all
+
+
+def walk(map_str: str) -> int:
+    return len(day6.get_visited_positions(day6.Map.from_str(map_str)))
+
+
+register(
+    Benchmark(
+        "day6.Map.step",
+        day6.INPUT_PATH,
+        repeat_sections,
+        day6.parse,
+        for_each_map(walk),
+    )
+)
+register(
+    Benchmark(
+        "day6.part2",
+        day6.INPUT_PATH,
+        repeat_sections,
+        day6.parse,
+        for_each_map(day6.part2),
+        max_scale=10,
+    )
+)
+register(
+    Benchmark(
+        "day6.parallel.part2",
+        day6.INPUT_PATH,
+        repeat_sections,
+        day6.parse,
+        for_each_map(parallel.part2),
+        max_scale=10,
+    )
+)
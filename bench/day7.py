@@ -0,0 +1,34 @@
+from bench.benchmark import Benchmark, register, repeat_lines
+from day7 import main as day7
+from day7 import parallel
+
+register(
+    Benchmark(
+        "day7.can_be_made_true",
+        day7.INPUT_PATH,
+        repeat_lines,
+        day7.parse,
+        day7.part1,
+        max_scale=10,
+    )
+)
+register(
+    Benchmark(
+        "day7.can_be_made_true_with_concat",
+        day7.INPUT_PATH,
+        repeat_lines,
+        day7.parse,
+        day7.part2,
+        max_scale=10,
+    )
+)
+register(
+    Benchmark(
+        "day7.parallel.part2",
+        day7.INPUT_PATH,
+        repeat_lines,
+        day7.parse,
+        parallel.part2,
+        max_scale=10,
+    )
+)
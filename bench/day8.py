@@ -0,0 +1,23 @@
+from bench.benchmark import Benchmark, register, tile_grid
+from day8 import main as day8
+
+register(
+    Benchmark(
+        "day8.count_antinodes",
+        day8.INPUT_PATH,
+        tile_grid,
+        day8.parse,
+        day8.part1,
+        max_scale=10,
+    )
+)
+register(
+    Benchmark(
+        "day8.count_antinodes2",
+        day8.INPUT_PATH,
+        tile_grid,
+        day8.parse,
+        day8.part2,
+        max_scale=10,
+    )
+)
@@ -0,0 +1,29 @@
+from bench.benchmark import Benchmark, register
+from day9 import main as day9
+
+
+def repeat_disk_map(text: str, factor: int) -> str:
+    # An empty free block keeps files and free blocks alternating between copies
+    return "0".join([text.strip()] * factor)
+
+
+register(
+    Benchmark(
+        "day9.Disk.compact",
+        day9.INPUT_PATH,
+        repeat_disk_map,
+        day9.parse,
+        day9.part1,
+        max_scale=10,
+    )
+)
+register(
+    Benchmark(
+        "day9.Disk.compact2",
+        day9.INPUT_PATH,
+        repeat_disk_map,
+        day9.parse,
+        day9.part2,
+        max_scale=1,
+    )
+)
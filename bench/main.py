@@ -0,0 +1,141 @@
+import argparse
+import importlib
+import json
+import math
+import pkgutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import bench
+from bench.benchmark import BENCHMARKS, Benchmark
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+# Benchmark name -> scale -> best time in seconds
+Timings = dict[str, dict[str, float]]
+
+
+def load_benchmarks() -> None:
+    day_modules = [
+        module_info.name
+        for module_info in pkgutil.iter_modules(bench.__path__)
+        if module_info.name.startswith("day")
+    ]
+    for day_module in sorted(day_modules, key=lambda name: int(name[len("day") :])):
+        importlib.import_module(f"bench.{day_module}")
+
+
+def time_benchmark(
+    benchmark: Benchmark[Any], scale: int, repeat: int, scratch_directory: Path
+) -> float:
+    input_path = benchmark.input_path
+    if scale != 1:
+        input_path = scratch_directory / f"{benchmark.name}-x{scale}.txt"
+        input_path.write_text(
+            benchmark.scale(benchmark.input_path.read_text("utf-8"), scale), "utf-8"
+        )
+
+    best = math.inf
+    for _ in range(repeat):
+        args = benchmark.setup(input_path)
+        start = time.perf_counter()
+        benchmark.run(args)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def describe_scaling(timings: dict[str, float]) -> str:
+    scales = sorted(int(scale) for scale in timings)
+    exponents = [
+        f"x{smaller}->x{larger} n^"
+        + f"{math.log(timings[str(larger)] / timings[str(smaller)], larger / smaller):.2f}"
+        for smaller, larger in zip(scales, scales[1:])
+    ]
+    return ", ".join(exponents)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the hot function of each day"
+    )
+    parser.add_argument(
+        "--filter", default="", help="only run benchmarks whose name contains this"
+    )
+    parser.add_argument(
+        "--scales",
+        type=lambda scales: [int(scale) for scale in scales.split(",")],
+        default=[1, 10, 100],
+        help="input scale factors to run each benchmark at (default: 1,10,100)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="runs per measurement; the best is kept"
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="write the measured timings to the baseline instead of checking them",
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=10.0,
+        help="percentage slowdown against the baseline that fails the run (default: 10)",
+    )
+    args = parser.parse_args()
+
+    load_benchmarks()
+    baseline: Timings = (
+        json.loads(args.baseline.read_text("utf-8")) if args.baseline.exists() else {}
+    )
+
+    timings: Timings = {}
+    regressions = []
+    with tempfile.TemporaryDirectory() as scratch_directory:
+        for benchmark in BENCHMARKS:
+            if args.filter not in benchmark.name:
+                continue
+
+            timings[benchmark.name] = {}
+            for scale in args.scales:
+                if scale > benchmark.max_scale:
+                    continue
+
+                seconds = time_benchmark(
+                    benchmark, scale, args.repeat, Path(scratch_directory)
+                )
+                timings[benchmark.name][str(scale)] = seconds
+
+                message = f"{benchmark.name} x{scale}: {seconds:.4f}s"
+                baseline_seconds = baseline.get(benchmark.name, {}).get(str(scale))
+                if baseline_seconds is not None:
+                    change = 100 * (seconds / baseline_seconds - 1)
+                    message += f" (baseline {baseline_seconds:.4f}s, {change:+.1f}%)"
+                    if change > args.max_regression:
+                        message += " REGRESSION"
+                        regressions.append(f"{benchmark.name} x{scale}")
+                print(message, flush=True)
+
+            if len(timings[benchmark.name]) > 1:
+                print(f"  scaling: {describe_scaling(timings[benchmark.name])}")
+
+    if args.update_baseline:
+        for name, scale_to_seconds in timings.items():
+            baseline.setdefault(name, {}).update(scale_to_seconds)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"Updated baseline {args.baseline}")
+        return
+
+    if regressions:
+        print(
+            f"{len(regressions)} benchmarks regressed by more than"
+            f" {args.max_regression}%: {', '.join(regressions)}"
+        )
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
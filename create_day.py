@@ -1,40 +1,70 @@
+import argparse
+import shutil
 import subprocess
-import sys
 from pathlib import Path
 
 YEAR = 2024
 PROJECT_ROOT = Path(__file__).parent.resolve()
 TEMPLATE = r"""from pathlib import Path
 
+from utils.cli import run_solution
+from utils.io import iter_lines
 
-def main() -> None:
-    input_lines = Path("input/input.txt").read_text("utf-8").strip().split("\n")
+INPUT_PATH = Path(__file__).parent / "input" / "input.txt"
+
+
+def parse(input_path: Path) -> list[str]:
+    return list(iter_lines(input_path))
+
+
+def part1(lines: list[str]) -> int:
+    return 0
+
+
+def part2(lines: list[str]) -> int:
+    return 0
+
+
+def main(input_path: Path = INPUT_PATH) -> None:
+    lines = parse(input_path)
+    print(part1(lines))
+    print(part2(lines))
 
 
 if __name__ == "__main__":
-    main()
+    run_solution(main, parse, [part1, part2], INPUT_PATH)
 """
+BENCH_TEMPLATE = r"""from bench.benchmark import Benchmark, register, repeat_lines
+from day{day} import main as day{day}
 
 
-def main() -> None:
-    if len(sys.argv) < 2:
-        print("Usage: python create_day.py <day number>")
-        return
+def scale_input(text: str, factor: int) -> str:
+    # Should give roughly factor times as much work, see also repeat_sections and tile_grid
+    return repeat_lines(text, factor)
 
-    day = int(sys.argv[1])
 
-    day_directory = PROJECT_ROOT / f"day{day}"
-    try:
-        day_directory.mkdir()
-    except FileExistsError:
-        print(f"Could not create {day_directory} since it already existed")
-        return
+register(
+    Benchmark(
+        "day{day}.part1",
+        day{day}.INPUT_PATH,
+        scale_input,
+        day{day}.parse,
+        day{day}.part1,
+    )
+)
+register(
+    Benchmark(
+        "day{day}.part2",
+        day{day}.INPUT_PATH,
+        scale_input,
+        day{day}.parse,
+        day{day}.part2,
+    )
+)
+"""
 
-    (day_directory / "__init__.py").write_text("")
-    (day_directory / "main.py").write_text(TEMPLATE)
-    input_directory = day_directory / "input"
-    input_directory.mkdir()
 
+def download_input(day: int, input_path: Path) -> None:
     # See https://github.com/GreenLightning/advent-of-code-downloader to set up input downloader
     try:
         subprocess.run(
@@ -45,7 +75,7 @@ def main() -> None:
                 "-day",
                 str(day),
                 "-output",
-                str((input_directory / "input.txt").resolve()),
+                str(input_path.resolve()),
             ],
             check=True,
         )
@@ -53,5 +83,37 @@ def main() -> None:
         print(f"Could not download input for {YEAR=} {day=}")
 
 
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Create a day's solution and benchmark from templates"
+    )
+    parser.add_argument("day", type=int)
+    parser.add_argument(
+        "--input",
+        type=Path,
+        help="copy the puzzle input from this file instead of downloading it",
+    )
+    args = parser.parse_args()
+    day = args.day
+
+    day_directory = PROJECT_ROOT / f"day{day}"
+    try:
+        day_directory.mkdir()
+    except FileExistsError:
+        print(f"Could not create {day_directory} since it already existed")
+        return
+
+    (day_directory / "__init__.py").write_text("")
+    (day_directory / "main.py").write_text(TEMPLATE)
+    (PROJECT_ROOT / "bench" / f"day{day}.py").write_text(BENCH_TEMPLATE.format(day=day))
+    input_directory = day_directory / "input"
+    input_directory.mkdir()
+
+    if args.input is not None:
+        shutil.copyfile(args.input, input_directory / "input.txt")
+    else:
+        download_input(day, input_directory / "input.txt")
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,165 @@
+import heapq
+import itertools
+import shutil
+import tempfile
+import weakref
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+from day1.main import INPUT_PATH, iter_column_chunks, print_answers
+from utils.cli import Option, run_solution
+
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+
+# Both numbers of a line, plus the Python ints that sorting a column builds
+BYTES_PER_LINE = 64
+
+# Merging more runs at once would need too many open files
+MAX_RUNS_PER_MERGE = 256
+
+ITEM_SIZE = array("q").itemsize
+
+
+def read_run(run: Path, block_size: int) -> Iterator[int]:
+    with run.open("rb") as f:
+        while True:
+            block: "array[int]" = array("q")
+            try:
+                block.fromfile(f, block_size)
+            except EOFError:
+                # The numbers left before the end of the file were still read
+                yield from block
+                return
+
+            yield from block
+
+
+def write_run(directory: Path, numbers: Iterable[int], block_size: int) -> Path:
+    with tempfile.NamedTemporaryFile(
+        "wb", dir=directory, suffix=".run", delete=False
+    ) as f:
+        iterator = iter(numbers)
+        while block := array("q", itertools.islice(iterator, block_size)):
+            block.tofile(f)
+
+    return Path(f.name)
+
+
+@dataclass
+class SortedRuns:
+    memory_budget: int = DEFAULT_MEMORY_BUDGET
+    n1_runs: list[Path] = field(default_factory=list)
+    n2_runs: list[Path] = field(default_factory=list)
+    directory: Path = field(
+        default_factory=lambda: Path(tempfile.mkdtemp(prefix="day1-"))
+    )
+    _cleanup: Callable[[], object] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Also removed if the SortedRuns are garbage collected without being closed
+        self._cleanup = weakref.finalize(
+            self, shutil.rmtree, self.directory, ignore_errors=True
+        )
+
+    def __enter__(self) -> "SortedRuns":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._cleanup()
+
+    @property
+    def block_size(self) -> int:
+        # Leaves room for both columns to be merged at the same time
+        return max(1, self.memory_budget // (2 * MAX_RUNS_PER_MERGE * ITEM_SIZE))
+
+    def add_chunk(self, n1s: "array[int]", n2s: "array[int]") -> None:
+        self.n1_runs.append(write_run(self.directory, sorted(n1s), self.block_size))
+        self.n2_runs.append(write_run(self.directory, sorted(n2s), self.block_size))
+
+    def merge(self, runs: list[Path]) -> Iterator[int]:
+        while len(runs) > MAX_RUNS_PER_MERGE:
+            merged_runs = []
+            for i in range(0, len(runs), MAX_RUNS_PER_MERGE):
+                group = runs[i : i + MAX_RUNS_PER_MERGE]
+                numbers = heapq.merge(
+                    *(read_run(run, self.block_size) for run in group)
+                )
+                merged_runs.append(write_run(self.directory, numbers, self.block_size))
+                for run in group:
+                    run.unlink()
+
+            runs[:] = merged_runs
+
+        return heapq.merge(*(read_run(run, self.block_size) for run in runs))
+
+    def sorted_n1s(self) -> Iterator[int]:
+        return self.merge(self.n1_runs)
+
+    def sorted_n2s(self) -> Iterator[int]:
+        return self.merge(self.n2_runs)
+
+
+def parse(input_path: Path, memory_budget: int = DEFAULT_MEMORY_BUDGET) -> SortedRuns:
+    sorted_runs = SortedRuns(memory_budget)
+    lines_per_chunk = max(1, memory_budget // BYTES_PER_LINE)
+
+    for columns in iter_column_chunks(input_path, lines_per_chunk):
+        sorted_runs.add_chunk(columns["n1s"], columns["n2s"])
+
+    return sorted_runs
+
+
+def part1(sorted_runs: SortedRuns) -> int:
+    return sum(
+        abs(n1 - n2)
+        for n1, n2 in zip(sorted_runs.sorted_n1s(), sorted_runs.sorted_n2s())
+    )
+
+
+def part2(sorted_runs: SortedRuns) -> int:
+    # Both streams are sorted, so this is a merge join
+    n2_frequencies = (
+        (n2, sum(1 for _ in group))
+        for n2, group in itertools.groupby(sorted_runs.sorted_n2s())
+    )
+    n2: Optional[int]
+    n2, n2_frequency = next(n2_frequencies, (None, 0))
+
+    similarity_score = 0
+    for n1 in sorted_runs.sorted_n1s():
+        while n2 is not None and n2 < n1:
+            n2, n2_frequency = next(n2_frequencies, (None, 0))
+
+        if n2 == n1:
+            similarity_score += n1 * n2_frequency
+
+    return similarity_score
+
+
+def main(
+    input_path: Path = INPUT_PATH, memory_budget: int = DEFAULT_MEMORY_BUDGET
+) -> None:
+    with parse(input_path, memory_budget) as sorted_runs:
+        print_answers(part1(sorted_runs), part2(sorted_runs))
+
+
+if __name__ == "__main__":
+    run_solution(
+        main,
+        parse,
+        [part1, part2],
+        INPUT_PATH,
+        [
+            Option(
+                "memory_budget",
+                int,
+                DEFAULT_MEMORY_BUDGET,
+                "bytes of numbers to sort in memory at once",
+            )
+        ],
+    )
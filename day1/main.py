@@ -1,25 +1,71 @@
+from array import array
 from collections import defaultdict
 from pathlib import Path
+from typing import Iterator, Optional, Sequence
 
+from utils.cli import run_solution
+from utils.io import iter_lines
+from utils.parse_cache import IntArrays, load_parsed
 
-def main() -> None:
-    input_lines = Path("input/input.txt").read_text("utf-8").split("\n")
-    n1s, n2s = zip(*[
-        (int(n1), int(n2))
-        for n1, n2 in [line.split(maxsplit=2) for line in input_lines if line != ""]
-    ])
+INPUT_PATH = Path(__file__).parent / "input" / "input.txt"
+
+Lists = tuple[Sequence[int], Sequence[int]]
+
+
+def iter_column_chunks(
+    input_path: Path, lines_per_chunk: Optional[int] = None
+) -> Iterator[IntArrays]:
+    n1s, n2s = array("q"), array("q")
+    for line in iter_lines(input_path):
+        n1, n2 = line.split(maxsplit=2)
+        n1s.append(int(n1))
+        n2s.append(int(n2))
+
+        if len(n1s) == lines_per_chunk:
+            yield {"n1s": n1s, "n2s": n2s}
+            n1s, n2s = array("q"), array("q")
+
+    if len(n1s) > 0:
+        yield {"n1s": n1s, "n2s": n2s}
+
+
+def parse_columns(input_path: Path) -> IntArrays:
+    return next(iter_column_chunks(input_path), {"n1s": array("q"), "n2s": array("q")})
+
+
+def parse(input_path: Path) -> Lists:
+    columns = load_parsed(input_path, parse_columns)
+    return columns["n1s"], columns["n2s"]
+
+
+def part1(lists: Lists) -> int:
+    n1s, n2s = lists
     sorted_n1s, sorted_n2s = sorted(n1s), sorted(n2s)
 
     distances = [abs(n1 - n2) for n1, n2 in zip(sorted_n1s, sorted_n2s)]
-    print(f"The total distance between the two lists is {sum(distances)}")
+    return sum(distances)
+
+
+def part2(lists: Lists) -> int:
+    n1s, n2s = lists
 
     n2_frequencies: dict[int, int] = defaultdict(int)
-    for n2 in sorted_n2s:
+    for n2 in n2s:
         n2_frequencies[n2] += 1
 
-    similarity_scores = [n1 * n2_frequencies[n1] for n1 in sorted_n1s]
-    print(f"The similarity score is {sum(similarity_scores)}")
+    similarity_scores = [n1 * n2_frequencies[n1] for n1 in n1s]
+    return sum(similarity_scores)
+
+
+def print_answers(total_distance: int, similarity_score: int) -> None:
+    print(f"The total distance between the two lists is {total_distance}")
+    print(f"The similarity score is {similarity_score}")
+
+
+def main(input_path: Path = INPUT_PATH) -> None:
+    lists = parse(input_path)
+    print_answers(part1(lists), part2(lists))
 
 
 if __name__ == "__main__":
-    main()
+    run_solution(main, parse, [part1, part2], INPUT_PATH)
@@ -0,0 +1,51 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+from day1.main import INPUT_PATH, print_answers
+from utils.cli import run_solution
+from utils.io import STDIN
+
+# Both lists as the rows of a 2 x n array, each sorted in ascending order
+Lists = npt.NDArray[np.int64]
+
+
+def parse(input_path: Path) -> Lists:
+    # Both read straight into int64 without building a Python int per number
+    if input_path == STDIN:
+        numbers = np.fromstring(sys.stdin.buffer.read(), dtype=np.int64, sep=" ")
+    else:
+        numbers = np.fromfile(input_path, dtype=np.int64, sep=" ")
+
+    if len(numbers) % 2 != 0:
+        raise ValueError(f"Expected two numbers on every line of {input_path}")
+
+    lists = numbers.reshape(-1, 2).T.copy()
+    lists.sort(axis=1)
+    return lists
+
+
+def part1(lists: Lists) -> int:
+    n1s, n2s = lists
+    return int(np.abs(n1s - n2s).sum())
+
+
+def part2(lists: Lists) -> int:
+    n1s, n2s = lists
+
+    n2_values, n2_frequencies = np.unique(n2s, return_counts=True)
+    indices = np.minimum(np.searchsorted(n2_values, n1s), len(n2_values) - 1)
+    is_in_n2s = n2_values[indices] == n1s
+
+    return int((n1s * n2_frequencies[indices] * is_in_n2s).sum())
+
+
+def main(input_path: Path = INPUT_PATH) -> None:
+    lists = parse(input_path)
+    print_answers(part1(lists), part2(lists))
+
+
+if __name__ == "__main__":
+    run_solution(main, parse, [part1, part2], INPUT_PATH)
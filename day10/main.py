@@ -1,9 +1,16 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Generic, Type, TypeVar
+from typing import Generic, Optional, Type, TypeVar
+
+from utils.cli import run_solution
+from utils.grid import Grid
+from utils.io import iter_lines
+
+INPUT_PATH = Path(__file__).parent / "input" / "input.txt"
+
+SUMMIT = ord("9")
 
-Coord = tuple[int, int]
 T = TypeVar("T", bound="ITrailMeasure")
 
 
@@ -15,7 +22,7 @@ class ITrailMeasure(ABC, Generic[T]):
 
     @staticmethod
     @abstractmethod
-    def one(coord: Coord) -> T:
+    def one(index: int) -> T:
         pass
 
     @abstractmethod
@@ -36,8 +43,8 @@ class Score(ITrailMeasure["Score"]):
         return Score(set())
 
     @staticmethod
-    def one(coord: Coord) -> "Score":
-        return Score({coord})
+    def one(index: int) -> "Score":
+        return Score({index})
 
     def combine(self, score: "Score") -> "Score":
         return Score(self.reachable_9s.union(score.reachable_9s))
@@ -55,7 +62,7 @@ class Rating(ITrailMeasure["Rating"]):
         return Rating(0)
 
     @staticmethod
-    def one(coord: Coord) -> "Rating":
+    def one(index: int) -> "Rating":
         return Rating(1)
 
     def combine(self, rating: "Rating") -> "Rating":
@@ -66,58 +73,56 @@ class Rating(ITrailMeasure["Rating"]):
 
 
 def get_measure(
-    coord: Coord,
-    topological_map: list[list[int]],
-    measure_cache: dict[Coord, T],
+    index: int,
+    topological_map: Grid,
+    measure_cache: list[Optional[T]],
     measure_cls: Type[T],
 ) -> T:
-    x, y = coord
-    if (x, y) in measure_cache:
-        return measure_cache[(x, y)]
+    cached_measure = measure_cache[index]
+    if cached_measure is not None:
+        return cached_measure
+
+    val = topological_map[index]
+    if val == SUMMIT:
+        measure = measure_cls.one(index)
+    else:
+        measure = measure_cls.zero()
+        for neighbour in topological_map.neighbours(index):
+            if val + 1 == topological_map[neighbour]:
+                measure = measure.combine(
+                    get_measure(neighbour, topological_map, measure_cache, measure_cls)
+                )
+
+    measure_cache[index] = measure
+    return measure
+
 
-    val = topological_map[y][x]
-    if val == 9:
-        return measure_cls.one(coord)
+def calculate_sum_of_measures(topological_map: Grid, measure_cls: Type[T]) -> int:
+    measure_cache: list[Optional[T]] = [None] * len(topological_map)
 
-    measure = measure_cls.zero()
-    for dx, dy in [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]:
-        if not (0 <= dx < len(topological_map[0]) and 0 <= dy < len(topological_map)):
-            continue
+    return sum(
+        get_measure(index, topological_map, measure_cache, measure_cls).get()
+        for index in topological_map.find_all("0")
+    )
 
-        if val + 1 == topological_map[dy][dx]:
-            measure = measure.combine(
-                get_measure((dx, dy), topological_map, measure_cache, measure_cls)
-            )
 
-    return measure
+def parse(input_path: Path) -> Grid:
+    return Grid.from_rows(list(iter_lines(input_path)))
 
 
-def calculate_sum_of_measures(
-    topological_map: list[list[int]], measure_cls: Type[T]
-) -> int:
-    coord_to_measure: dict[Coord, T] = dict()
-    for y in range(len(topological_map)):
-        for x in range(len(topological_map)):
-            coord_to_measure[(x, y)] = get_measure(
-                (x, y), topological_map, coord_to_measure, measure_cls
-            )
+def part1(topological_map: Grid) -> int:
+    return calculate_sum_of_measures(topological_map, Score)
 
-    return sum(
-        score.get()
-        for (x, y), score in coord_to_measure.items()
-        if topological_map[y][x] == 0
-    )
 
+def part2(topological_map: Grid) -> int:
+    return calculate_sum_of_measures(topological_map, Rating)
 
-def main() -> None:
-    topological_map = [
-        [int(val) for val in row]
-        for row in Path("input/input.txt").read_text("utf-8").strip().split("\n")
-    ]
 
-    print(calculate_sum_of_measures(topological_map, Score))
-    print(calculate_sum_of_measures(topological_map, Rating))
+def main(input_path: Path = INPUT_PATH) -> None:
+    topological_map = parse(input_path)
+    print(part1(topological_map))
+    print(part2(topological_map))
 
 
 if __name__ == "__main__":
-    main()
+    run_solution(main, parse, [part1, part2], INPUT_PATH)
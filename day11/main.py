@@ -1,7 +1,14 @@
+from array import array
 from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 
+from utils.cli import run_solution
+from utils.io import read_text
+from utils.parse_cache import IntArrays, load_parsed
+
+INPUT_PATH = Path(__file__).parent / "input" / "input.txt"
+
 
 @dataclass(frozen=True)
 class Stone:
@@ -37,15 +44,27 @@ def get_number_of_stones_after_b_blinks(stones: list[Stone], n: int) -> int:
     return sum(occurrences for occurrences in stone_to_occurrences.values())
 
 
-def main() -> None:
-    stones = [
-        Stone(int(num))
-        for num in Path("input/input.txt").read_text("utf-8").strip().split(" ")
-    ]
+def parse_stones(input_path: Path) -> IntArrays:
+    return {"stones": array("q", [int(num) for num in read_text(input_path).split()])}
+
+
+def parse(input_path: Path) -> list[Stone]:
+    return [Stone(num) for num in load_parsed(input_path, parse_stones)["stones"]]
+
+
+def part1(stones: list[Stone]) -> int:
+    return get_number_of_stones_after_b_blinks(stones, 25)
+
+
+def part2(stones: list[Stone]) -> int:
+    return get_number_of_stones_after_b_blinks(stones, 75)
+
 
-    print(get_number_of_stones_after_b_blinks(stones, 25))
-    print(get_number_of_stones_after_b_blinks(stones, 75))
+def main(input_path: Path = INPUT_PATH) -> None:
+    stones = parse(input_path)
+    print(part1(stones))
+    print(part2(stones))
 
 
 if __name__ == "__main__":
-    main()
+    run_solution(main, parse, [part1, part2], INPUT_PATH)
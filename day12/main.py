@@ -2,9 +2,13 @@ from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import FrozenSet
+from typing import FrozenSet, Optional
 
-Coord = tuple[int, int]
+from utils.cli import run_solution
+from utils.grid import Coord, Grid
+from utils.io import iter_lines
+
+INPUT_PATH = Path(__file__).parent / "input" / "input.txt"
 
 X = 0
 Y = 1
@@ -26,12 +30,12 @@ class Edge:
 @dataclass(frozen=True)
 class Region:
     letter: str
-    coords: FrozenSet[Coord]
+    cells: FrozenSet[int]
     edges: FrozenSet[Edge]
 
     @property
     def area(self) -> int:
-        return len(self.coords)
+        return len(self.cells)
 
     @property
     def perimeter(self) -> int:
@@ -75,66 +79,84 @@ class Region:
         )
 
 
-def calculate_region_coords_and_edges(
-    coord: Coord, farm_map: list[str], letter: str, coords: set[Coord], edges: set[Edge]
+def calculate_region_cells_and_edges(
+    index: int, farm_map: Grid, cells: set[int], edges: set[Edge]
 ) -> None:
-    if coord in coords:
-        return
-
-    coords.add(coord)
-
-    x, y = coord
-    for edge in [
-        Edge((x + 1, y), EdgeSide.LEFT),
-        Edge((x - 1, y), EdgeSide.RIGHT),
-        Edge((x, y + 1), EdgeSide.TOP),
-        Edge((x, y - 1), EdgeSide.BOTTOM),
-    ]:
-        dx, dy = edge.coord
-        if (
-            not (0 <= dx < len(farm_map[0]) and 0 <= dy < len(farm_map))
-            or farm_map[dy][dx] != letter
-        ):
-            edges.add(edge)
+    letter = farm_map[index]
+    to_visit = [index]
+    while len(to_visit) > 0:
+        index = to_visit.pop()
+        if index in cells:
             continue
 
-        calculate_region_coords_and_edges((dx, dy), farm_map, letter, coords, edges)
+        cells.add(index)
+
+        x, y = farm_map.coord(index)
+        for edge in [
+            Edge((x + 1, y), EdgeSide.LEFT),
+            Edge((x - 1, y), EdgeSide.RIGHT),
+            Edge((x, y + 1), EdgeSide.TOP),
+            Edge((x, y - 1), EdgeSide.BOTTOM),
+        ]:
+            if (
+                not farm_map.in_bounds(*edge.coord)
+                or farm_map[farm_map.index(*edge.coord)] != letter
+            ):
+                edges.add(edge)
+                continue
+
+            to_visit.append(farm_map.index(*edge.coord))
 
 
 def get_region(
-    coord: Coord, farm_map: list[str], coord_to_region: dict[Coord, Region]
+    index: int, farm_map: Grid, cell_to_region: list[Optional[Region]]
 ) -> Region:
-    if coord in coord_to_region:
-        return coord_to_region[coord]
+    existing_region = cell_to_region[index]
+    if existing_region is not None:
+        return existing_region
 
-    x, y = coord
-    letter = farm_map[y][x]
-    coords: set[Coord] = set()
+    cells: set[int] = set()
     edges: set[Edge] = set()
-    calculate_region_coords_and_edges(coord, farm_map, letter, coords, edges)
+    calculate_region_cells_and_edges(index, farm_map, cells, edges)
 
-    region = Region(letter, frozenset(coords), frozenset(edges))
+    region = Region(farm_map.char(index), frozenset(cells), frozenset(edges))
 
-    for coord in coords:
-        coord_to_region[coord] = region
+    for cell in cells:
+        cell_to_region[cell] = region
 
     return region
 
 
-def main() -> None:
-    farm_map = Path("input/input.txt").read_text("utf-8").strip().split("\n")
-    regions = set()
-    coord_to_region: dict[Coord, Region] = dict()
-    height = len(farm_map)
-    width = len(farm_map[0])
+def find_regions(farm_map: Grid) -> list[Region]:
+    regions = []
+    cell_to_region: list[Optional[Region]] = [None] * len(farm_map)
+
+    for index in range(len(farm_map)):
+        if cell_to_region[index] is None:
+            regions.append(get_region(index, farm_map, cell_to_region))
+
+    return regions
+
+
+def parse(input_path: Path) -> Grid:
+    return Grid.from_rows(list(iter_lines(input_path)))
+
+
+def part1(farm_map: Grid) -> int:
+    return sum(region.area * region.perimeter for region in find_regions(farm_map))
+
+
+def part2(farm_map: Grid) -> int:
+    return sum(
+        region.area * region.calculate_num_sides() for region in find_regions(farm_map)
+    )
 
-    for x in range(width):
-        for y in range(height):
-            regions.add(get_region((x, y), farm_map, coord_to_region))
 
-    print(sum(region.area * region.perimeter for region in regions))
-    print(sum(region.area * region.calculate_num_sides() for region in regions))
+def main(input_path: Path = INPUT_PATH) -> None:
+    farm_map = parse(input_path)
+    print(part1(farm_map))
+    print(part2(farm_map))
 
 
 if __name__ == "__main__":
-    main()
+    run_solution(main, parse, [part1, part2], INPUT_PATH)
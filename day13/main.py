@@ -1,7 +1,14 @@
 from dataclasses import dataclass
 from pathlib import Path
 
-from utils.helpers import parse_value_between_strings
+from utils.cli import run_solution
+from utils.helpers import extract_ints
+from utils.io import read_mapped
+from utils.parse_cache import IntArrays, load_parsed
+
+INPUT_PATH = Path(__file__).parent / "input" / "input.txt"
+
+PRIZE_OFFSET = 10_000_000_000_000
 
 Vector = tuple[int, int]
 
@@ -12,17 +19,11 @@ class ClawMachine:
     a: Vector
     b: Vector
 
-    @staticmethod
-    def from_str(raw_machine: str, prize_offset: int = 0) -> "ClawMachine":
-        raw_a, raw_b, raw_prize = raw_machine.split("\n", maxsplit=3)
-        a_x = parse_value_between_strings(raw_a, "X+", ",", int)
-        a_y = int(raw_a[raw_a.find("Y+") + len("Y+") :])
-        b_x = parse_value_between_strings(raw_b, "X+", ",", int)
-        b_y = int(raw_b[raw_b.find("Y+") + len("Y+") :])
-        prize_x = prize_offset + parse_value_between_strings(raw_prize, "X=", ",", int)
-        prize_y = prize_offset + int(raw_prize[raw_prize.find("Y=") + len("Y=") :])
-
-        return ClawMachine((prize_x, prize_y), (a_x, a_y), (b_x, b_y))
+    def with_prize_offset(self, prize_offset: int) -> "ClawMachine":
+        prize_x, prize_y = self.prize
+        return ClawMachine(
+            (prize_x + prize_offset, prize_y + prize_offset), self.a, self.b
+        )
 
     def get_price(self) -> int:
         (p1, p2), (a1, a2), (b1, b2) = self.prize, self.a, self.b
@@ -35,18 +36,39 @@ class ClawMachine:
         return 3 * int(x) + int(y)
 
 
-def main() -> None:
-    raw_machines = Path("input/input.txt").read_text("utf-8").strip().split("\n\n")
+def parse_machines(input_path: Path) -> IntArrays:
+    # a_x, a_y, b_x, b_y, prize_x, prize_y for each machine
+    return {"machines": extract_ints(read_mapped(input_path), 6)}
 
-    claw_machines = [ClawMachine.from_str(raw_machine) for raw_machine in raw_machines]
-    print(sum(claw_machine.get_price() for claw_machine in claw_machines))
 
-    claw_machines_with_offset = [
-        ClawMachine.from_str(raw_machine, prize_offset=10_000_000_000_000)
-        for raw_machine in raw_machines
+def parse(input_path: Path) -> list[ClawMachine]:
+    machines = load_parsed(input_path, parse_machines)["machines"]
+    return [
+        ClawMachine(
+            (machines[i + 4], machines[i + 5]),
+            (machines[i], machines[i + 1]),
+            (machines[i + 2], machines[i + 3]),
+        )
+        for i in range(0, len(machines), 6)
     ]
-    print(sum(claw_machine.get_price() for claw_machine in claw_machines_with_offset))
+
+
+def part1(claw_machines: list[ClawMachine]) -> int:
+    return sum(claw_machine.get_price() for claw_machine in claw_machines)
+
+
+def part2(claw_machines: list[ClawMachine]) -> int:
+    return sum(
+        claw_machine.with_prize_offset(PRIZE_OFFSET).get_price()
+        for claw_machine in claw_machines
+    )
+
+
+def main(input_path: Path = INPUT_PATH) -> None:
+    claw_machines = parse(input_path)
+    print(part1(claw_machines))
+    print(part2(claw_machines))
 
 
 if __name__ == "__main__":
-    main()
+    run_solution(main, parse, [part1, part2], INPUT_PATH)
@@ -4,9 +4,19 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+from utils.cli import run_solution
+from utils.helpers import extract_ints
+from utils.io import read_mapped
+from utils.parse_cache import IntArrays, load_parsed
+
+INPUT_PATH = Path(__file__).parent / "input" / "input.txt"
+
 Vector = tuple[int, int]
 
 
+# Shorter runs such as "111111" also appear by chance before the robots draw the picture
+PICTURE_MARKER = "1" * 10
+
 WIDTH = 101
 HEIGHT = 103
 
@@ -16,13 +26,8 @@ class Robot:
     position: Vector
     velocity: Vector
 
-    @staticmethod
-    def from_str(raw_robot: str) -> "Robot":
-        raw_p, raw_v = raw_robot.split(" ", maxsplit=2)
-        px, py = [int(n) for n in raw_p[2:].split(",", maxsplit=2)]
-        vx, vy = [int(n) for n in raw_v[2:].split(",", maxsplit=2)]
-
-        return Robot((px, py), (vx, vy))
+    def copy(self) -> "Robot":
+        return Robot(self.position, self.velocity)
 
     def step(self) -> None:
         (px, py), (vx, vy) = self.position, self.velocity
@@ -80,30 +85,54 @@ def get_map(robots: list[Robot]) -> str:
     return robot_map
 
 
-def main() -> None:
-    input_lines = Path("input/input.txt").read_text("utf-8").strip().split("\n")
-    robots = [Robot.from_str(raw_robot) for raw_robot in input_lines]
+def parse_robots(input_path: Path) -> IntArrays:
+    # px, py, vx, vy for each robot
+    return {"robots": extract_ints(read_mapped(input_path), 4)}
 
-    for i in range(100):
+
+def parse(input_path: Path) -> list[Robot]:
+    robots = load_parsed(input_path, parse_robots)["robots"]
+    return [
+        Robot((robots[i], robots[i + 1]), (robots[i + 2], robots[i + 3]))
+        for i in range(0, len(robots), 4)
+    ]
+
+
+def part1(robots: list[Robot]) -> int:
+    robots = [robot.copy() for robot in robots]
+    for _ in range(100):
         for robot in robots:
             robot.step()
 
-    print(safety_factor(robots))
+    return safety_factor(robots)
+
 
-    robots = [Robot.from_str(raw_robot) for raw_robot in input_lines]
+def part2(robots: list[Robot]) -> int:
+    robots = [robot.copy() for robot in robots]
     for i in range(100_000_000):
-        coord_to_count: dict[Vector, int] = defaultdict(int)
+        robot_map = get_map(robots)
+        if PICTURE_MARKER in robot_map:
+            return i
+
         for robot in robots:
-            coord_to_count[robot.position] += 1
+            robot.step()
 
-        robot_map = get_map(robots)
-        if "111111" in robot_map:
-            print(i)
-            print(robot_map)
+    raise ValueError("The robots never arranged themselves into a picture")
 
+
+def main(input_path: Path = INPUT_PATH) -> None:
+    robots = parse(input_path)
+    print(part1(robots))
+
+    seconds = part2(robots)
+    robots = [robot.copy() for robot in robots]
+    for _ in range(seconds):
         for robot in robots:
             robot.step()
 
+    print(seconds)
+    print(get_map(robots))
+
 
 if __name__ == "__main__":
-    main()
+    run_solution(main, parse, [part1, part2], INPUT_PATH)
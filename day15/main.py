@@ -1,117 +1,114 @@
 from pathlib import Path
 
-Vector = tuple[int, int]
+from utils.cli import run_solution
+from utils.grid import Coord, Grid
+from utils.io import iter_sections
 
+INPUT_PATH = Path(__file__).parent / "input" / "input.txt"
 
-MOVE = {"^": (0, -1), ">": (1, 0), "v": (0, 1), "<": (-1, 0)}
+MOVE: dict[str, Coord] = {"^": (0, -1), ">": (1, 0), "v": (0, 1), "<": (-1, 0)}
 
+WALL = ord("#")
+EMPTY = ord(".")
+BOX = ord("O")
+BOX_LEFT = ord("[")
+BOX_RIGHT = ord("]")
 
-def process_move(move: str, board: list[list[str]], pos: Vector) -> Vector:
-    (x, y) = pos
-    (dx, dy) = MOVE[move]
+WIDENED_CELLS = {"#": "##", "O": "[]", ".": "..", "@": "@."}
+
+
+def process_move(move: str, board: Grid, pos: int) -> int:
+    dx, dy = MOVE[move]
+    step = board.offset(dx, dy)
 
     to_process = [pos]
-    to_push = list()
+    to_push = []
+    pushed = set()
     while len(to_process) > 0:
-        next_x, next_y = to_process.pop()
-        c = board[next_y][next_x]
+        next_pos = to_process.pop()
+        c = board[next_pos]
 
-        if c == "#":
+        if c == WALL:
             return pos
 
-        if c == ".":
+        if c == EMPTY:
             continue
 
-        to_push.append((next_x, next_y))
-        to_process.append((next_x + dx, next_y + dy))
+        to_push.append(next_pos)
+        pushed.add(next_pos)
+        to_process.append(next_pos + step)
 
         if dx == 0:
-            if c == "[" and (next_x + 1, next_y) not in to_push:
-                to_process.append((next_x + 1, next_y))
-            if c == "]" and (next_x - 1, next_y) not in to_push:
-                to_process.append((next_x - 1, next_y))
+            if c == BOX_LEFT and next_pos + 1 not in pushed:
+                to_process.append(next_pos + 1)
+            if c == BOX_RIGHT and next_pos - 1 not in pushed:
+                to_process.append(next_pos - 1)
 
-    board_copy = [[c for c in row] for row in board]
-    for x1, y1 in to_push:
-        board[y1][x1] = "."
-    for x1, y1 in to_push:
-        board[y1 + dy][x1 + dx] = board_copy[y1][x1]
+    pushed_cells = [board[pushed_pos] for pushed_pos in to_push]
+    for pushed_pos in to_push:
+        board[pushed_pos] = EMPTY
+    for pushed_pos, c in zip(to_push, pushed_cells):
+        board[pushed_pos + step] = c
 
-    board[y][x] = "."
+    board[pos] = EMPTY
 
-    return x + dx, y + dy
+    return pos + step
 
 
-def find_robot(board: list[list[str]]) -> Vector:
-    height = len(board)
-    width = len(board[0])
-    for x in range(width):
-        for y in range(height):
-            if board[y][x] == "@":
-                return x, y
+def sum_of_gps_coords(board: Grid) -> int:
+    result = 0
+    for index, c in enumerate(board.cells):
+        if c in (BOX, BOX_LEFT):
+            y, x = divmod(index, board.width)
+            result += 100 * y + x
 
-    raise ValueError("Could not find robot")
+    return result
 
 
-def board_str(board: list[list[str]]) -> str:
-    return "\n".join("".join(line) for line in board)
+def widen_board(board: Grid) -> Grid:
+    return Grid.from_rows(
+        [
+            "".join(WIDENED_CELLS[c] for c in board.row(y).tobytes().decode("ascii"))
+            for y in range(board.height)
+        ]
+    )
 
 
-def sum_of_gps_coords(board: list[list[str]]) -> int:
-    result = 0
-    height = len(board)
-    width = len(board[0])
-    for x in range(width):
-        for y in range(height):
-            if board[y][x] == "O" or board[y][x] == "[":
-                result += 100 * y + x
+def parse(input_path: Path) -> tuple[Grid, list[str]]:
+    raw_board, raw_moves = iter_sections(input_path)
+    board = Grid.from_rows(raw_board)
+    moves = list("".join(raw_moves))
 
-    return result
+    return board, moves
 
 
-def widen_board(board: list[list[str]]) -> list[list[str]]:
-    height = len(board)
-    width = len(board[0])
-    widened_board = []
-    for y in range(height):
-        row = []
-        for x in range(width):
-            if board[y][x] == "#":
-                row += ["#", "#"]
-            elif board[y][x] == "O":
-                row += ["[", "]"]
-            elif board[y][x] == ".":
-                row += [".", "."]
-            elif board[y][x] == "@":
-                row += ["@", "."]
-            else:
-                raise ValueError
-
-        widened_board.append(row)
-
-    return widened_board
-
-
-def main() -> None:
-    raw_board, raw_moves = (
-        Path("input/input.txt").read_text("utf-8").strip().split("\n\n")
-    )
-    board = [list(s) for s in raw_board.split("\n")]
-    moves: list[str] = [c for c in [line for line in raw_moves.split("\n")]]
+def part1(board_and_moves: tuple[Grid, list[str]]) -> int:
+    board, moves = board_and_moves
+    board = board.copy()
 
-    position = find_robot(board)
+    position = board.find("@")
     for move in moves:
         position = process_move(move, board, position)
 
-    print(sum_of_gps_coords(board))
+    return sum_of_gps_coords(board)
+
 
-    widened_board = widen_board([list(s) for s in raw_board.split("\n")])
-    position = find_robot(widened_board)
+def part2(board_and_moves: tuple[Grid, list[str]]) -> int:
+    board, moves = board_and_moves
+
+    widened_board = widen_board(board)
+    position = widened_board.find("@")
     for move in moves:
         position = process_move(move, widened_board, position)
 
-    print(sum_of_gps_coords(widened_board))
+    return sum_of_gps_coords(widened_board)
+
+
+def main(input_path: Path = INPUT_PATH) -> None:
+    board_and_moves = parse(input_path)
+    print(part1(board_and_moves))
+    print(part2(board_and_moves))
 
 
 if __name__ == "__main__":
-    main()
+    run_solution(main, parse, [part1, part2], INPUT_PATH)
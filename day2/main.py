@@ -1,35 +1,102 @@
+from array import array
 from pathlib import Path
+from typing import Optional
+
+from utils.cli import run_solution
+from utils.io import iter_lines
+from utils.parse_cache import IntArrays, load_parsed
+
+INPUT_PATH = Path(__file__).parent / "input" / "input.txt"
+
+# Reports must either be all increasing or all decreasing
+DIRECTIONS = (1, -1)
+
+
+def is_safe_step(level: int, next_level: int, direction: int) -> bool:
+    return 1 <= (next_level - level) * direction <= 3
+
+
+def first_unsafe_step(
+    report: list[int], direction: int, start: int = 0
+) -> Optional[int]:
+    for i in range(start, len(report) - 1):
+        if not is_safe_step(report[i], report[i + 1], direction):
+            return i
+
+    return None
 
 
 def is_safe(report: list[int]) -> bool:
-    is_sorted = report == sorted(report) or report == sorted(report, reverse=True)
+    return any(first_unsafe_step(report, direction) is None for direction in DIRECTIONS)
+
 
-    differences = [abs(x - y) for x, y in zip(report[1:], report[:-1])]
-    are_differences_safe = all(1 <= diff <= 3 for diff in differences)
+def is_safe_without(report: list[int], direction: int, removed: int) -> bool:
+    # Only called with every step before the removed level already known to be safe
+    if 0 < removed < len(report) - 1 and not is_safe_step(
+        report[removed - 1], report[removed + 1], direction
+    ):
+        return False
 
-    return is_sorted and are_differences_safe
+    return first_unsafe_step(report, direction, removed + 1) is None
 
 
 def is_safe_with_dampener(report: list[int]) -> bool:
-    sub_reports = [report[:i] + report[i + 1 :] for i in range(len(report))]
+    # Removing any level but the two of the first unsafe step leaves that step in place
+    for direction in DIRECTIONS:
+        unsafe_step = first_unsafe_step(report, direction)
+        if unsafe_step is None:
+            return True
+
+        if is_safe_without(report, direction, unsafe_step) or is_safe_without(
+            report, direction, unsafe_step + 1
+        ):
+            return True
+
+    return False
 
-    return any(is_safe(sub_report) for sub_report in sub_reports)
 
+def parse_reports(input_path: Path) -> IntArrays:
+    levels, report_ends = array("q"), array("q")
+    for line in iter_lines(input_path):
+        levels.extend(int(n) for n in line.split())
+        report_ends.append(len(levels))
 
-def main() -> None:
-    input_lines = Path("input/input.txt").read_text("utf-8").split("\n")
-    reports = [[int(n) for n in line.split()] for line in input_lines if line != ""]
-    safe_reports = [report for report in reports if is_safe(report)]
-    print(f"There were {len(safe_reports)} safe reports")
+    return {"levels": levels, "report_ends": report_ends}
 
-    safe_reports_with_dampener = [
-        report for report in reports if is_safe_with_dampener(report)
-    ]
+
+def parse(input_path: Path) -> list[list[int]]:
+    arrays = load_parsed(input_path, parse_reports)
+    levels = arrays["levels"]
+
+    reports = []
+    report_start = 0
+    for report_end in arrays["report_ends"]:
+        reports.append(levels[report_start:report_end].tolist())
+        report_start = report_end
+
+    return reports
+
+
+def part1(reports: list[list[int]]) -> int:
+    return sum(1 for report in reports if is_safe(report))
+
+
+def part2(reports: list[list[int]]) -> int:
+    return sum(1 for report in reports if is_safe_with_dampener(report))
+
+
+def print_answers(safe_reports: int, safe_reports_with_dampener: int) -> None:
+    print(f"There were {safe_reports} safe reports")
     print(
         "Accounting for the problem dampener, there are"
-        f" {len(safe_reports_with_dampener)} safe reports"
+        f" {safe_reports_with_dampener} safe reports"
     )
 
 
+def main(input_path: Path = INPUT_PATH) -> None:
+    reports = parse(input_path)
+    print_answers(part1(reports), part2(reports))
+
+
 if __name__ == "__main__":
-    main()
+    run_solution(main, parse, [part1, part2], INPUT_PATH)
@@ -0,0 +1,97 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+from day2.main import DIRECTIONS, INPUT_PATH, parse_reports, print_answers
+from utils.cli import run_solution
+from utils.parse_cache import load_parsed
+
+Levels = npt.NDArray[np.int64]
+Mask = npt.NDArray[np.bool_]
+
+
+@dataclass
+class Reports:
+    # One row per report, padded with zeros up to the longest report
+    levels: Levels
+    lengths: Levels
+
+
+def is_safe_difference(differences: Levels, direction: int) -> Mask:
+    signed_differences = differences * direction
+    return (signed_differences >= 1) & (signed_differences <= 3)
+
+
+def safe_steps(reports: Reports, direction: int) -> Mask:
+    # Steps into the padding count as safe
+    steps = np.diff(reports.levels, axis=1)
+    is_padding = np.arange(steps.shape[1]) >= reports.lengths[:, None] - 1
+    return is_padding | is_safe_difference(steps, direction)
+
+
+def is_safe(reports: Reports) -> Mask:
+    safe = np.zeros(len(reports.lengths), dtype=np.bool_)
+    for direction in DIRECTIONS:
+        safe |= safe_steps(reports, direction).all(axis=1)
+
+    return safe
+
+
+def is_safe_with_dampener(reports: Reports) -> Mask:
+    # Removing level k needs the steps around it and the one joining k - 1 to k + 1 safe
+    count, width = reports.levels.shape
+    removed = np.arange(width)
+    always = np.ones((count, 1), dtype=np.bool_)
+
+    dampened = np.zeros(count, dtype=np.bool_)
+    for direction in DIRECTIONS:
+        steps = safe_steps(reports, direction)
+        # prefix[:, k] is whether steps[:, :k] are safe, and suffix[:, k] steps[:, k:]
+        prefix = np.hstack([always, np.logical_and.accumulate(steps, axis=1)])
+        suffix = np.hstack(
+            [np.logical_and.accumulate(steps[:, ::-1], axis=1)[:, ::-1], always]
+        )
+
+        joins = np.ones((count, width), dtype=np.bool_)
+        skips = reports.levels[:, 2:] - reports.levels[:, :-2]
+        is_padding = removed[1:-1] >= reports.lengths[:, None] - 1
+        joins[:, 1:-1] = is_padding | is_safe_difference(skips, direction)
+
+        dampened |= (
+            prefix[:, np.maximum(removed - 1, 0)]
+            & joins
+            & suffix[:, np.minimum(removed + 1, width - 1)]
+        ).any(axis=1)
+
+    return dampened
+
+
+def parse(input_path: Path) -> Reports:
+    arrays = load_parsed(input_path, parse_reports)
+    levels = np.asarray(arrays["levels"])
+    lengths = np.diff(np.asarray(arrays["report_ends"]), prepend=0)
+
+    width = int(lengths.max(initial=0))
+    padded_levels = np.zeros((len(lengths), width), dtype=np.int64)
+    padded_levels[np.arange(width) < lengths[:, None]] = levels
+
+    return Reports(padded_levels, lengths)
+
+
+def part1(reports: Reports) -> int:
+    return int(is_safe(reports).sum())
+
+
+def part2(reports: Reports) -> int:
+    return int(is_safe_with_dampener(reports).sum())
+
+
+def main(input_path: Path = INPUT_PATH) -> None:
+    reports = parse(input_path)
+    print_answers(part1(reports), part2(reports))
+
+
+if __name__ == "__main__":
+    run_solution(main, parse, [part1, part2], INPUT_PATH)
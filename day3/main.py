@@ -1,24 +1,33 @@
 import re
 from pathlib import Path
 
-MUL_REGEX = r"mul\((\d{1,3}),(\d{1,3})\)"
-MUL_AND_CONDITIONALS_REGEX = rf"({MUL_REGEX})|(do\(\))|(don't\(\))"
+from utils.cli import run_solution
+from utils.io import Buffer, read_mapped
 
+INPUT_PATH = Path(__file__).parent / "input" / "input.txt"
 
-def main() -> None:
-    input_text = Path("input/input.txt").read_text("utf-8")
+MUL_REGEX = rb"mul\((\d{1,3}),(\d{1,3})\)"
+MUL_AND_CONDITIONALS_REGEX = b"(" + MUL_REGEX + rb")|(do\(\))|(don't\(\))"
 
+
+def parse(input_path: Path) -> Buffer:
+    return read_mapped(input_path)
+
+
+def part1(memory: Buffer) -> int:
     total = 0
-    for match in re.finditer(MUL_REGEX, input_text):
+    for match in re.finditer(MUL_REGEX, memory):
         x = int(match.group(1))
         y = int(match.group(2))
         total += x * y
 
-    print(f"If you add up all the multiplications you get {total}")
+    return total
 
+
+def part2(memory: Buffer) -> int:
     enabled = True
     total_with_conditionals = 0
-    for match in re.finditer(MUL_AND_CONDITIONALS_REGEX, input_text):
+    for match in re.finditer(MUL_AND_CONDITIONALS_REGEX, memory):
         if match.group(4):
             enabled = True
             continue
@@ -32,11 +41,17 @@ def main() -> None:
             y = int(match.group(3))
             total_with_conditionals += x * y
 
+    return total_with_conditionals
+
+
+def main(input_path: Path = INPUT_PATH) -> None:
+    memory = parse(input_path)
+    print(f"If you add up all the multiplications you get {part1(memory)}")
     print(
         "When accounting for conditional statements, if you add up all the"
-        f" multiplications you get {total_with_conditionals}"
+        f" multiplications you get {part2(memory)}"
     )
 
 
 if __name__ == "__main__":
-    main()
+    run_solution(main, parse, [part1, part2], INPUT_PATH)
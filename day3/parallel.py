@@ -0,0 +1,106 @@
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from pathlib import Path
+from typing import Optional
+
+from day3.main import INPUT_PATH
+from day3.streaming import INSTRUCTION_REGEX, MAX_INSTRUCTION_LENGTH
+from utils.cli import run_solution
+from utils.io import STDIN, Buffer, read_mapped
+
+# Smaller ranges cost more to hand to a worker than to scan
+MIN_RANGE_SIZE = 4 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class Summary:
+    # The totals of a range of the memory for either state it starts in
+    total: int = 0
+    total_if_enabled: int = 0
+    total_if_disabled: int = 0
+    # Whether the last do() or don't() of the range enables, or None if it has neither
+    final_enabled: Optional[bool] = None
+
+    def ends_enabled(self, starts_enabled: bool) -> bool:
+        return starts_enabled if self.final_enabled is None else self.final_enabled
+
+    def total_with_conditionals(self, starts_enabled: bool) -> int:
+        return self.total_if_enabled if starts_enabled else self.total_if_disabled
+
+    def followed_by(self, other: "Summary") -> "Summary":
+        return Summary(
+            self.total + other.total,
+            self.total_if_enabled
+            + other.total_with_conditionals(self.ends_enabled(True)),
+            self.total_if_disabled
+            + other.total_with_conditionals(self.ends_enabled(False)),
+            self.final_enabled if other.final_enabled is None else other.final_enabled,
+        )
+
+
+def summarise(memory: Buffer, start: int, end: int) -> Summary:
+    # No instruction can start inside another, so ranges can be scanned on their own
+    total = total_if_enabled = total_if_disabled = 0
+    final_enabled: Optional[bool] = None
+
+    scan_end = min(end + MAX_INSTRUCTION_LENGTH - 1, len(memory))
+    for match in INSTRUCTION_REGEX.finditer(memory, start, scan_end):
+        if match.start() >= end:
+            break
+
+        if match.group(4):
+            final_enabled = True
+        elif match.group(5):
+            final_enabled = False
+        else:
+            product = int(match.group(2)) * int(match.group(3))
+            total += product
+            if final_enabled is not False:
+                total_if_enabled += product
+            if final_enabled is True:
+                total_if_disabled += product
+
+    return Summary(total, total_if_enabled, total_if_disabled, final_enabled)
+
+
+def summarise_range(input_path: Path, start: int, end: int) -> Summary:
+    return summarise(read_mapped(input_path), start, end)
+
+
+def parse(input_path: Path, jobs: Optional[int] = None) -> Summary:
+    memory = read_mapped(input_path)
+    jobs = jobs or os.cpu_count() or 1
+    range_size = max(MIN_RANGE_SIZE, -(-len(memory) // jobs))
+    if input_path == STDIN or range_size >= len(memory):
+        return summarise(memory, 0, len(memory))
+
+    starts = range(0, len(memory), range_size)
+    ends = [min(start + range_size, len(memory)) for start in starts]
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        summaries = executor.map(summarise_range, repeat(input_path), starts, ends)
+        return functools.reduce(Summary.followed_by, summaries, Summary())
+
+
+def part1(summary: Summary) -> int:
+    return summary.total
+
+
+def part2(summary: Summary) -> int:
+    # The memory starts with mul instructions enabled
+    return summary.total_with_conditionals(True)
+
+
+def main(input_path: Path = INPUT_PATH) -> None:
+    summary = parse(input_path)
+    print(f"If you add up all the multiplications you get {part1(summary)}")
+    print(
+        "When accounting for conditional statements, if you add up all the"
+        f" multiplications you get {part2(summary)}"
+    )
+
+
+if __name__ == "__main__":
+    run_solution(main, parse, [part1, part2], INPUT_PATH)
@@ -0,0 +1,80 @@
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+from day3.main import INPUT_PATH, MUL_AND_CONDITIONALS_REGEX
+from utils.cli import run_solution
+from utils.io import iter_chunks
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+MAX_INSTRUCTION_LENGTH = len(b"mul(123,456)")
+
+INSTRUCTION_REGEX = re.compile(MUL_AND_CONDITIONALS_REGEX)
+
+
+@dataclass
+class Scanner:
+    total: int = 0
+    total_with_conditionals: int = 0
+    enabled: bool = True
+    tail: bytes = b""
+
+    def feed(self, chunk: bytes) -> None:
+        memory = self.tail + chunk
+        # Instructions starting after the cutoff may continue into the next chunk
+        cutoff = len(memory) - (MAX_INSTRUCTION_LENGTH - 1)
+        self.tail = memory[self._scan(memory, cutoff) :]
+
+    def finish(self) -> None:
+        self._scan(self.tail, len(self.tail))
+        self.tail = b""
+
+    def _scan(self, memory: bytes, cutoff: int) -> int:
+        scanned_until = max(cutoff, 0)
+        for match in INSTRUCTION_REGEX.finditer(memory):
+            if match.start() >= cutoff:
+                break
+
+            scanned_until = max(cutoff, match.end())
+            if match.group(4):
+                self.enabled = True
+            elif match.group(5):
+                self.enabled = False
+            else:
+                product = int(match.group(2)) * int(match.group(3))
+                self.total += product
+                if self.enabled:
+                    self.total_with_conditionals += product
+
+        return scanned_until
+
+
+def parse(input_path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Scanner:
+    scanner = Scanner()
+    for chunk in iter_chunks(input_path, chunk_size):
+        scanner.feed(chunk)
+    scanner.finish()
+
+    return scanner
+
+
+def part1(scanner: Scanner) -> int:
+    return scanner.total
+
+
+def part2(scanner: Scanner) -> int:
+    return scanner.total_with_conditionals
+
+
+def main(input_path: Path = INPUT_PATH) -> None:
+    scanner = parse(input_path)
+    print(f"If you add up all the multiplications you get {part1(scanner)}")
+    print(
+        "When accounting for conditional statements, if you add up all the"
+        f" multiplications you get {part2(scanner)}"
+    )
+
+
+if __name__ == "__main__":
+    run_solution(main, parse, [part1, part2], INPUT_PATH)
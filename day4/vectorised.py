@@ -0,0 +1,97 @@
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+from day4 import main as day4
+from day4.main import INPUT_PATH, MAS, XMAS
+from utils.cli import run_solution
+from utils.grid import ALL_DIRECTIONS
+
+Cells = npt.NDArray[np.uint8]
+Mask = npt.NDArray[np.bool_]
+
+# Rows of word starts compared at once, so that masks stay small on large grids
+BAND_HEIGHT = 256
+
+
+def shifted(cells: Cells, rows: slice, columns: slice, dx: int, dy: int) -> Cells:
+    return cells[
+        rows.start + dy : rows.stop + dy, columns.start + dx : columns.stop + dx
+    ]
+
+
+def word_starts(cells: Cells, length: int, dx: int, dy: int) -> tuple[range, slice]:
+    height, width = cells.shape
+    reach_x, reach_y = (length - 1) * dx, (length - 1) * dy
+    return (
+        range(max(0, -reach_y), height - max(0, reach_y)),
+        slice(max(0, -reach_x), width - max(0, reach_x)),
+    )
+
+
+def count_word(cells: Cells, word: bytes, dx: int, dy: int) -> int:
+    start_rows, columns = word_starts(cells, len(word), dx, dy)
+    if len(start_rows) == 0 or columns.start >= columns.stop:
+        return 0
+
+    count = 0
+    for band_row in start_rows[::BAND_HEIGHT]:
+        rows = slice(band_row, min(band_row + BAND_HEIGHT, start_rows.stop))
+        found = shifted(cells, rows, columns, 0, 0) == word[0]
+        for i, letter in enumerate(word[1:], start=1):
+            found &= shifted(cells, rows, columns, i * dx, i * dy) == letter
+
+        count += int(np.count_nonzero(found))
+
+    return count
+
+
+def is_mas_diagonal(
+    cells: Cells, rows: slice, columns: slice, dx: int, dy: int
+) -> Mask:
+    start = shifted(cells, rows, columns, -dx, -dy)
+    end = shifted(cells, rows, columns, dx, dy)
+    return ((start == MAS[0]) & (end == MAS[2])) | ((start == MAS[2]) & (end == MAS[0]))
+
+
+def count_crosses(cells: Cells) -> int:
+    height, width = cells.shape
+    columns = slice(1, width - 1)
+    if height < 3 or width < 3:
+        return 0
+
+    count = 0
+    for band_row in range(1, height - 1, BAND_HEIGHT):
+        rows = slice(band_row, min(band_row + BAND_HEIGHT, height - 1))
+        found = (
+            (shifted(cells, rows, columns, 0, 0) == MAS[1])
+            & is_mas_diagonal(cells, rows, columns, 1, 1)
+            & is_mas_diagonal(cells, rows, columns, 1, -1)
+        )
+        count += int(np.count_nonzero(found))
+
+    return count
+
+
+def parse(input_path: Path) -> Cells:
+    grid = day4.parse(input_path)
+    return np.frombuffer(grid.cells, dtype=np.uint8).reshape(grid.height, grid.width)
+
+
+def part1(cells: Cells) -> int:
+    return sum(count_word(cells, XMAS, dx, dy) for dx, dy in ALL_DIRECTIONS)
+
+
+def part2(cells: Cells) -> int:
+    return count_crosses(cells)
+
+
+def main(input_path: Path = INPUT_PATH) -> None:
+    cells = parse(input_path)
+    print(f"Total 'XMAS' patterns: {part1(cells)}")
+    print(f"Total 'XMAS Cross' patterns: {part2(cells)}")
+
+
+if __name__ == "__main__":
+    run_solution(main, parse, [part1, part2], INPUT_PATH)
@@ -0,0 +1,70 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterable
+
+from utils.grid import Grid
+
+
+@dataclass
+class AhoCorasick:
+    words: list[bytes]
+    # A letter without a transition goes back to the root
+    transitions: list[dict[int, int]]
+    # The words ending at each state, including those only reached through failure links
+    matches: list[list[int]]
+
+    @staticmethod
+    def from_words(words: Iterable[bytes]) -> "AhoCorasick":
+        unique_words = list(dict.fromkeys(words))
+        transitions: list[dict[int, int]] = [{}]
+        matches: list[list[int]] = [[]]
+        for i, word in enumerate(unique_words):
+            if len(word) == 0:
+                raise ValueError("Cannot search for an empty word")
+
+            state = 0
+            for letter in word:
+                if letter not in transitions[state]:
+                    transitions[state][letter] = len(transitions)
+                    transitions.append({})
+                    matches.append([])
+                state = transitions[state][letter]
+            matches[state].append(i)
+
+        alphabet = {letter for word in unique_words for letter in word}
+        failures = [0] * len(transitions)
+        queue = deque(transitions[0].values())
+        # Breadth first, so that the failure state of each state is already complete
+        while len(queue) > 0:
+            state = queue.popleft()
+            matches[state] += matches[failures[state]]
+
+            children = dict(transitions[state])
+            for letter in alphabet:
+                fallback = transitions[failures[state]].get(letter, 0)
+                if letter in children:
+                    failures[children[letter]] = fallback
+                    queue.append(children[letter])
+                elif fallback != 0:
+                    transitions[state][letter] = fallback
+
+        return AhoCorasick(unique_words, transitions, matches)
+
+    def count(self, texts: Iterable[bytes]) -> dict[bytes, int]:
+        counts = [0] * len(self.words)
+        transitions, matches = self.transitions, self.matches
+        for text in texts:
+            state = 0
+            for letter in text:
+                state = transitions[state].get(letter, 0)
+                for word in matches[state]:
+                    counts[word] += 1
+
+        return dict(zip(self.words, counts))
+
+
+def count_words(grid: Grid, words: Iterable[bytes]) -> dict[bytes, int]:
+    automaton = AhoCorasick.from_words(words)
+    return automaton.count(
+        line[::direction] for line in grid.lines() for direction in (1, -1)
+    )
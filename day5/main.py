@@ -1,7 +1,17 @@
-from collections import defaultdict
+import itertools
+from collections import Counter, deque
 from dataclasses import dataclass
-from functools import cmp_to_key
 from pathlib import Path
+from typing import AbstractSet, Optional
+
+from utils.cli import run_solution
+from utils.io import iter_sections
+
+INPUT_PATH = Path(__file__).parent / "input" / "input.txt"
+
+Update = list[int]
+
+NO_PAGES: frozenset[int] = frozenset()
 
 
 @dataclass
@@ -16,71 +26,125 @@ class Rule:
         return Rule(int(comes_first), int(comes_second))
 
 
+@dataclass
+class UpdateGraph:
+    pages: Update
+    successors: dict[int, set[int]]
+
+    def topological_order(self) -> Update:
+        # Kahn's algorithm
+        in_degrees = Counter(itertools.chain.from_iterable(self.successors.values()))
+
+        ready = deque(page for page in self.pages if in_degrees[page] == 0)
+        order: Update = []
+        while len(ready) > 0:
+            page = ready.popleft()
+            order.append(page)
+            for successor in self.successors[page]:
+                in_degrees[successor] -= 1
+                if in_degrees[successor] == 0:
+                    ready.append(successor)
+
+        if len(order) != len(self.pages):
+            raise ValueError(f"The rules for update {self.pages} contain a cycle")
+
+        return order
+
+
+def ranked_middle_page(update: Update, pages_after: list[int]) -> Optional[int]:
+    pages_after_middle = len(update) - 1 - len(update) // 2
+    # Half of the other pages only come after the middle one when all pairs are ranked
+    if (
+        sum(pages_after) == len(update) * (len(update) - 1) // 2
+        and pages_after_middle in pages_after
+    ):
+        return update[pages_after.index(pages_after_middle)]
+
+    return None
+
+
 @dataclass
 class Comparer:
     _comes_first_to_all_that_come_second: dict[int, set[int]]
 
     @staticmethod
     def from_rules(rules: list[Rule]) -> "Comparer":
-        comes_first_to_all_that_come_second = defaultdict(set)
+        comparer = Comparer({})
         for rule in rules:
-            comes_first_to_all_that_come_second[rule.comes_first].add(rule.comes_second)
+            comparer.add_rule(rule)
+
+        return comparer
+
+    def add_rule(self, rule: Rule) -> None:
+        self._comes_first_to_all_that_come_second.setdefault(
+            rule.comes_first, set()
+        ).add(rule.comes_second)
+
+    def comes_second(self, page: int) -> AbstractSet[int]:
+        return self._comes_first_to_all_that_come_second.get(page, NO_PAGES)
 
-        return Comparer(comes_first_to_all_that_come_second)
+    def update_graph(self, update: Update) -> UpdateGraph:
+        pages = set(update)
+        return UpdateGraph(
+            update, {page: pages & self.comes_second(page) for page in update}
+        )
 
-    def compare(self, a: int, b: int) -> int:
-        if b in self._comes_first_to_all_that_come_second[a]:
-            return -1
+    def is_ordered(self, update: Update) -> bool:
+        seen: set[int] = set()
+        for page in update:
+            if not self.comes_second(page).isdisjoint(seen):
+                return False
+            seen.add(page)
 
-        if a in self._comes_first_to_all_that_come_second[b]:
-            return 1
+        return True
 
-        return 0
+    def corrected_middle_page(self, update: Update) -> int:
+        pages = set(update)
+        middle_page = ranked_middle_page(
+            update, [len(pages & self.comes_second(page)) for page in update]
+        )
+        if middle_page is not None:
+            return middle_page
 
+        return self.update_graph(update).topological_order()[len(update) // 2]
 
-def main() -> None:
-    raw_rules, raw_updates = Path("input/input.txt").read_text("utf-8").split("\n\n")
 
-    rules = [Rule.from_str(raw_rule) for raw_rule in raw_rules.split("\n")]
-    updates = [
-        [int(x) for x in raw_update.split(",")]
-        for raw_update in raw_updates.split("\n")
-        if raw_update != ""
-    ]
+def parse(input_path: Path) -> tuple[Comparer, list[Update]]:
+    raw_rules, raw_updates = iter_sections(input_path)
 
-    comparer = Comparer.from_rules(rules)
-    sorted_updates = [
-        sorted(update, key=cmp_to_key(comparer.compare)) for update in updates
-    ]
+    rules = [Rule.from_str(raw_rule) for raw_rule in raw_rules]
+    updates = [[int(x) for x in raw_update.split(",")] for raw_update in raw_updates]
 
-    correctly_ordered_updates = [
-        update
-        for update, sorted_update in zip(updates, sorted_updates)
-        if update == sorted_update
-    ]
-    sum_of_correctly_ordered_middles = sum(
-        update[len(update) // 2] for update in correctly_ordered_updates
+    return Comparer.from_rules(rules), updates
+
+
+def part1(rules_and_updates: tuple[Comparer, list[Update]]) -> int:
+    comparer, updates = rules_and_updates
+    return sum(
+        update[len(update) // 2] for update in updates if comparer.is_ordered(update)
     )
-    print(
-        "If you add up the middle page number from all correctly-ordered updates, you"
-        f" get {sum_of_correctly_ordered_middles}"
+
+
+def part2(rules_and_updates: tuple[Comparer, list[Update]]) -> int:
+    comparer, updates = rules_and_updates
+    return sum(
+        comparer.corrected_middle_page(update)
+        for update in updates
+        if not comparer.is_ordered(update)
     )
 
-    sorted_version_of_incorrectly_ordered_updates = [
-        sorted_update
-        for update, sorted_update in zip(updates, sorted_updates)
-        if update != sorted_update
-    ]
-    sum_of_sorted_version_of_incorrectly_ordered_middles = sum(
-        update[len(update) // 2]
-        for update in sorted_version_of_incorrectly_ordered_updates
+
+def main(input_path: Path = INPUT_PATH) -> None:
+    rules_and_updates = parse(input_path)
+    print(
+        "If you add up the middle page number from all correctly-ordered updates, you"
+        f" get {part1(rules_and_updates)}"
     )
     print(
         "If you add up the middle page number from the sorted version of the"
-        " incorrectly-ordered updates, you get"
-        f" {sum_of_sorted_version_of_incorrectly_ordered_middles}"
+        f" incorrectly-ordered updates, you get {part2(rules_and_updates)}"
     )
 
 
 if __name__ == "__main__":
-    main()
+    run_solution(main, parse, [part1, part2], INPUT_PATH)
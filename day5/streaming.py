@@ -0,0 +1,143 @@
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+from day5.main import INPUT_PATH, Comparer, Rule, Update, ranked_middle_page
+from utils.cli import run_solution
+from utils.io import iter_lines
+
+
+@dataclass
+class RuleIndex:
+    comparer: Comparer = field(default_factory=lambda: Comparer({}))
+    # Comparer's adjacency again, as bitsets over the bits given to the pages
+    bits: dict[int, int] = field(default_factory=dict)
+    comes_second: list[int] = field(default_factory=list)
+
+    @staticmethod
+    def from_rules(rules: Iterable[Rule]) -> "RuleIndex":
+        rule_index = RuleIndex()
+        for rule in rules:
+            rule_index.add_rule(rule)
+
+        return rule_index
+
+    def bit(self, page: int) -> int:
+        if page not in self.bits:
+            self.bits[page] = len(self.bits)
+            self.comes_second.append(0)
+
+        return self.bits[page]
+
+    def add_rule(self, rule: Rule) -> None:
+        # The rules as a whole are cyclic, but never contradict each other directly
+        if rule.comes_first in self.comparer.comes_second(rule.comes_second):
+            raise ValueError(f"{rule} contradicts an earlier rule")
+
+        self.comparer.add_rule(rule)
+        first, second = self.bit(rule.comes_first), self.bit(rule.comes_second)
+        self.comes_second[first] |= 1 << second
+
+    def mask(self, update: Update) -> int:
+        # Pages no rule mentions yet are not given a bit, so they have no rules either
+        mask = 0
+        for page in update:
+            if page in self.bits:
+                mask |= 1 << self.bits[page]
+
+        return mask
+
+    def is_ordered(self, update: Update) -> bool:
+        seen = 0
+        for page in update:
+            if page in self.bits:
+                bit = self.bits[page]
+                if self.comes_second[bit] & seen:
+                    return False
+                seen |= 1 << bit
+
+        return True
+
+    def corrected_middle_page(self, update: Update) -> int:
+        mask = self.mask(update)
+        middle_page = ranked_middle_page(
+            update,
+            [
+                (
+                    (self.comes_second[self.bits[page]] & mask).bit_count()
+                    if page in self.bits
+                    else 0
+                )
+                for page in update
+            ],
+        )
+        if middle_page is not None:
+            return middle_page
+
+        return self.comparer.update_graph(update).topological_order()[len(update) // 2]
+
+
+@dataclass
+class StreamResult:
+    ordered_middle_pages: int = 0
+    corrected_middle_pages: int = 0
+    updates: int = 0
+    seconds: float = 0.0
+
+    @property
+    def updates_per_second(self) -> float:
+        return self.updates / self.seconds if self.seconds > 0 else 0.0
+
+
+def check_updates(lines: Iterable[str]) -> StreamResult:
+    # Each update is checked against the rules that came before it
+    rule_index = RuleIndex()
+    result = StreamResult()
+    start = time.perf_counter()
+    for line in lines:
+        if "|" in line:
+            rule_index.add_rule(Rule.from_str(line))
+            continue
+
+        update = [int(page) for page in line.split(",")]
+        if rule_index.is_ordered(update):
+            result.ordered_middle_pages += update[len(update) // 2]
+        else:
+            result.corrected_middle_pages += rule_index.corrected_middle_page(update)
+        result.updates += 1
+
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def parse(input_path: Path) -> StreamResult:
+    return check_updates(iter_lines(input_path))
+
+
+def part1(result: StreamResult) -> int:
+    return result.ordered_middle_pages
+
+
+def part2(result: StreamResult) -> int:
+    return result.corrected_middle_pages
+
+
+def main(input_path: Path = INPUT_PATH) -> None:
+    result = parse(input_path)
+    print(
+        "If you add up the middle page number from all correctly-ordered updates, you"
+        f" get {part1(result)}"
+    )
+    print(
+        "If you add up the middle page number from the sorted version of the"
+        f" incorrectly-ordered updates, you get {part2(result)}"
+    )
+    print(
+        f"Checked {result.updates} updates in {result.seconds:.3f}s"
+        f" ({result.updates_per_second:,.0f} updates/s)"
+    )
+
+
+if __name__ == "__main__":
+    run_solution(main, parse, [part1, part2], INPUT_PATH)
@@ -1,15 +1,26 @@
+import bisect
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
+from typing import Optional
 
-Coord = tuple[int, int]
+from utils.cli import run_solution
+from utils.grid import Coord, Grid
+from utils.io import read_text
+
+INPUT_PATH = Path(__file__).parent / "input" / "input.txt"
+
+
+# The (dx, dy) of each Direction, in the order the guard turns through them
+TURN_ORDER: list[Coord] = [(0, -1), (1, 0), (0, 1), (-1, 0)]
 
 
 class Direction(Enum):
-    LEFT = 0
+    UP = 0
     RIGHT = 1
-    UP = 2
-    DOWN = 3
+    DOWN = 2
+    LEFT = 3
 
 
 @dataclass
@@ -22,110 +33,215 @@ class Guard:
         return Guard(position, Direction.UP)
 
     def get_next_position(self) -> Coord:
-        (x, y) = self.position
-        if self.direction == Direction.RIGHT:
-            return x + 1, y
-        if self.direction == Direction.DOWN:
-            return x, y + 1
-        if self.direction == Direction.LEFT:
-            return x - 1, y
-        if self.direction == Direction.UP:
-            return x, y - 1
-
-        raise ValueError("Unknown Direction")
+        x, y = self.position
+        dx, dy = TURN_ORDER[self.direction.value]
+        return x + dx, y + dy
 
     def move_forward(self) -> None:
         self.position = self.get_next_position()
 
     def turn_90_deg_right(self) -> None:
-        if self.direction == Direction.RIGHT:
-            self.direction = Direction.DOWN
-        elif self.direction == Direction.DOWN:
-            self.direction = Direction.LEFT
-        elif self.direction == Direction.LEFT:
-            self.direction = Direction.UP
-        elif self.direction == Direction.UP:
-            self.direction = Direction.RIGHT
-        else:
-            raise ValueError("Unknown Direction")
+        self.direction = Direction((self.direction.value + 1) % len(TURN_ORDER))
+
+
+OBSTACLE = ord("#")
 
 
 @dataclass
 class Map:
-    width: int
-    height: int
-    obstacles: set[Coord]
+    grid: Grid
     guard: Guard
 
     @staticmethod
     def from_str(map_str: str) -> "Map":
-        obstacles = set()
-        guard = None
-
-        rows = map_str.split("\n")
-        height = len(rows)
-        width = len(rows[0])
-        for y in range(height):
-            for x in range(width):
-                if rows[y][x] == ".":
-                    continue
-                if rows[y][x] == "^":
-                    guard = Guard.create((x, y))
-                if rows[y][x] == "#":
-                    obstacles.add((x, y))
-
-        if guard is None:
-            raise ValueError("No guard found")
-
-        return Map(width, height, obstacles, guard)
+        grid = Grid.from_str(map_str)
+        guard = Guard.create(grid.coord(grid.find("^")))
+
+        return Map(grid, guard)
 
     def step(self) -> bool:
-        if self.guard.get_next_position() in self.obstacles:
+        next_position = self.guard.get_next_position()
+        if (
+            self.is_in_map(next_position)
+            and self.grid[self.grid.index(*next_position)] == OBSTACLE
+        ):
             self.guard.turn_90_deg_right()
-        else:
-            self.guard.move_forward()
+            return True
+
+        self.guard.position = next_position
+        return self.is_in_map(next_position)
 
-        return self.is_in_map(self.guard.position)
+    def add_obstacle(self, coord: Coord) -> None:
+        self.grid[self.grid.index(*coord)] = OBSTACLE
 
     def is_in_map(self, coord: Coord) -> bool:
         x, y = coord
-        return 0 <= x < self.width and 0 <= y < self.height
-
+        return 0 <= x < self.grid.width and 0 <= y < self.grid.height
 
-def main() -> None:
-    map_str = Path("input/input.txt").read_text("utf-8").strip()
-    area_map = Map.from_str(map_str)
 
-    visited_positions = {area_map.guard.position}
+def get_visited_positions(area_map: Map) -> list[Coord]:
+    grid = area_map.grid
+    visited = bytearray(len(grid))
+    visited[grid.index(*area_map.guard.position)] = 1
     while area_map.step():
-        visited_positions.add(area_map.guard.position)
+        visited[grid.index(*area_map.guard.position)] = 1
+
+    return [
+        grid.coord(index) for index, was_visited in enumerate(visited) if was_visited
+    ]
+
 
-    print(f"The guard visits {len(visited_positions)} unique positions")
+@dataclass
+class JumpTable:
+    width: int
+    height: int
+    # The x of each obstacle in a row, and the y of each obstacle in a column
+    row_obstacles: list[list[int]]
+    column_obstacles: list[list[int]]
 
-    num_loops = 0
-    for x, y in visited_positions:
-        area_map = Map.from_str(map_str)
-        if (x, y) == area_map.guard.position:
-            continue
+    @staticmethod
+    def from_grid(grid: Grid) -> "JumpTable":
+        row_obstacles: list[list[int]] = [[] for _ in range(grid.height)]
+        column_obstacles: list[list[int]] = [[] for _ in range(grid.width)]
+        for index in grid.find_all(chr(OBSTACLE)):
+            x, y = grid.coord(index)
+            row_obstacles[y].append(x)
+            column_obstacles[x].append(y)
+
+        return JumpTable(grid.width, grid.height, row_obstacles, column_obstacles)
+
+    def next_stop(
+        self, position: Coord, direction: int, extra_obstacle: Optional[Coord]
+    ) -> Optional[Coord]:
+        # None if the guard walks off the map before reaching an obstacle
+        x, y = position
+        dx, dy = TURN_ORDER[direction]
+        if dy == 0:
+            obstacles, along, step = self.row_obstacles[y], x, dx
+            extra = (
+                extra_obstacle[0] if extra_obstacle and extra_obstacle[1] == y else None
+            )
+        else:
+            obstacles, along, step = self.column_obstacles[x], y, dy
+            extra = (
+                extra_obstacle[1] if extra_obstacle and extra_obstacle[0] == x else None
+            )
 
-        area_map.obstacles.add((x, y))
-        visited_positions_and_directions = {
-            (area_map.guard.position, area_map.guard.direction)
-        }
-        while area_map.step():
+        obstacle: Optional[int]
+        if step > 0:
+            i = bisect.bisect_right(obstacles, along)
+            obstacle = obstacles[i] if i < len(obstacles) else None
+            if (
+                extra is not None
+                and along < extra
+                and (obstacle is None or extra < obstacle)
+            ):
+                obstacle = extra
+        else:
+            i = bisect.bisect_left(obstacles, along) - 1
+            obstacle = obstacles[i] if i >= 0 else None
             if (
-                area_map.guard.position,
-                area_map.guard.direction,
-            ) in visited_positions_and_directions:
-                num_loops += 1
+                extra is not None
+                and extra < along
+                and (obstacle is None or obstacle < extra)
+            ):
+                obstacle = extra
+
+        if obstacle is None:
+            return None
+
+        return (obstacle - step, y) if dy == 0 else (x, obstacle - step)
+
+    @cached_property
+    def visited_turns(self) -> bytearray:
+        # Kept allocated across checks, which clear the turns they set
+        return bytearray(self.width * self.height * len(TURN_ORDER))
+
+    def leads_to_loop(
+        self, position: Coord, direction: int, extra_obstacle: Optional[Coord]
+    ) -> bool:
+        # The guard loops once it turns at the same place facing the same way twice
+        visited_turns = self.visited_turns
+        turns = []
+        loops = False
+        while True:
+            stop = self.next_stop(position, direction, extra_obstacle)
+            if stop is None:
                 break
 
-            visited_positions_and_directions.add(
-                (area_map.guard.position, area_map.guard.direction)
-            )
+            position, direction = stop, (direction + 1) % len(TURN_ORDER)
+            x, y = position
+            turn = (y * self.width + x) * len(TURN_ORDER) + direction
+            if visited_turns[turn]:
+                loops = True
+                break
+            visited_turns[turn] = 1
+            turns.append(turn)
+
+        for turn in turns:
+            visited_turns[turn] = 0
+
+        return loops
+
+
+def get_path(area_map: Map) -> list[tuple[Coord, int]]:
+    guard = area_map.guard
+    path = [(guard.position, guard.direction.value)]
+    while area_map.step():
+        path.append((guard.position, guard.direction.value))
+
+    return path
+
+
+def get_first_entries(path: list[tuple[Coord, int]]) -> dict[Coord, tuple[Coord, int]]:
+    start, _ = path[0]
+    first_entries: dict[Coord, tuple[Coord, int]] = {start: path[0]}
+    for state, (next_position, _) in zip(path, path[1:]):
+        if next_position not in first_entries:
+            first_entries[next_position] = state
+
+    del first_entries[start]
+    return first_entries
+
+
+# An obstacle, and the guard's state right before it would first walk into it
+Candidate = tuple[Coord, Coord, int]
+
+
+def loop_candidates(area_map: Map) -> list[Candidate]:
+    # An obstacle only changes the path from where the guard would first walk into it
+    return [
+        (obstacle, position, direction)
+        for obstacle, (position, direction) in get_first_entries(
+            get_path(area_map)
+        ).items()
+    ]
+
+
+def parse(input_path: Path) -> str:
+    return read_text(input_path).strip()
+
+
+def part1(map_str: str) -> int:
+    return len(get_visited_positions(Map.from_str(map_str)))
+
+
+def part2(map_str: str) -> int:
+    area_map = Map.from_str(map_str)
+    jump_table = JumpTable.from_grid(area_map.grid)
+
+    return sum(
+        1
+        for obstacle, position, direction in loop_candidates(area_map)
+        if jump_table.leads_to_loop(position, direction, obstacle)
+    )
+
 
-    print(f"{num_loops} obstructions positions result in a guard loop")
+def main(input_path: Path = INPUT_PATH) -> None:
+    map_str = parse(input_path)
+    print(f"The guard visits {part1(map_str)} unique positions")
+    print(f"{part2(map_str)} obstructions positions result in a guard loop")
 
 
 if __name__ == "__main__":
-    main()
+    run_solution(main, parse, [part1, part2], INPUT_PATH)
@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from day6.main import (
+    INPUT_PATH,
+    Candidate,
+    JumpTable,
+    Map,
+    loop_candidates,
+    parse,
+    part1,
+)
+from utils.cli import run_solution
+from utils.pool import BatchResult, map_batches, worker_throughputs
+
+# Set once per worker, so that the map is not sent along with every batch
+WORKER_STATE: dict[str, JumpTable] = {}
+
+
+@dataclass
+class LoopSearch:
+    loops: int
+    batches: list[BatchResult[int]]
+
+
+def start_worker(jump_table: JumpTable) -> None:
+    WORKER_STATE["jump_table"] = jump_table
+
+
+def count_loops(candidates: list[Candidate]) -> int:
+    jump_table = WORKER_STATE["jump_table"]
+    return sum(
+        1
+        for obstacle, position, direction in candidates
+        if jump_table.leads_to_loop(position, direction, obstacle)
+    )
+
+
+def find_loops(map_str: str, jobs: Optional[int] = None) -> LoopSearch:
+    area_map = Map.from_str(map_str)
+    jump_table = JumpTable.from_grid(area_map.grid)
+    batches = map_batches(
+        count_loops,
+        loop_candidates(area_map),
+        jobs,
+        initializer=start_worker,
+        initargs=(jump_table,),
+    )
+    return LoopSearch(sum(batch.result for batch in batches), batches)
+
+
+def part2(map_str: str) -> int:
+    return find_loops(map_str).loops
+
+
+def main(input_path: Path = INPUT_PATH) -> None:
+    map_str = parse(input_path)
+    print(f"The guard visits {part1(map_str)} unique positions")
+
+    loop_search = find_loops(map_str)
+    print(f"{loop_search.loops} obstructions positions result in a guard loop")
+    for worker, throughput in sorted(worker_throughputs(loop_search.batches).items()):
+        print(f"  worker {worker}: {throughput:,.0f} candidates/s")
+
+
+if __name__ == "__main__":
+    run_solution(main, parse, [part1, part2], INPUT_PATH)
@@ -1,44 +1,59 @@
 import operator
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterable, Optional
 
-Operator = Callable[[int, int], int]
+from utils.cli import run_solution
+from utils.io import iter_lines
+from utils.parse_cache import IntArrays, load_parsed
 
+INPUT_PATH = Path(__file__).parent / "input" / "input.txt"
 
-class IExpression(ABC):
-    @abstractmethod
-    def evaluate(self) -> int:
-        pass
+Operator = Callable[[int, int], int]
+# The left operand giving the result with the right one, or None if there is none
+Inverse = Callable[[int, int], Optional[int]]
 
 
 @dataclass(frozen=True)
-class Constant(IExpression):
-    value: int
+class OperatorDefinition:
+    name: str
+    apply: Operator
+    inverse: Optional[Inverse] = None
+    # Whether the result is never below the left operand for a positive right operand
+    non_decreasing: bool = False
 
-    def evaluate(self) -> int:
-        return self.value
 
+OPERATORS: dict[str, OperatorDefinition] = {}
 
-@dataclass(frozen=True)
-class Operation(IExpression):
-    left: IExpression
-    right: IExpression
-    operator: Operator
 
-    def evaluate(self) -> int:
-        return self.operator(self.left.evaluate(), self.right.evaluate())
+def register_operator(definition: OperatorDefinition) -> OperatorDefinition:
+    if definition.name in OPERATORS:
+        raise ValueError(f"An operator named {definition.name!r} is already registered")
+
+    OPERATORS[definition.name] = definition
+    return definition
+
+
+def get_operators(names: Iterable[str]) -> list[OperatorDefinition]:
+    names = list(names)
+    unknown = [name for name in names if name not in OPERATORS]
+    if len(unknown) > 0:
+        raise ValueError(f"Unknown operators: {', '.join(unknown)}")
+
+    return [OPERATORS[name] for name in names]
 
 
 @dataclass
 class Equation:
     result: int
     inputs: list[int]
-    possible_operators: list[Operator]
+    possible_operators: list[OperatorDefinition]
 
     @staticmethod
-    def from_str(equation_str: str, possible_operators: list[Operator]) -> "Equation":
+    def from_str(
+        equation_str: str, possible_operators: list[OperatorDefinition]
+    ) -> "Equation":
         raw_result, raw_inputs = equation_str.split(": ")
 
         return Equation(
@@ -48,47 +63,147 @@ class Equation:
         )
 
     def can_be_made_true(self) -> bool:
-        expressions: list[IExpression] = [Constant(self.inputs[0])]
-        for constant in self.inputs[1:]:
-            next_expressions, expressions = expressions, []
-            for expression in next_expressions:
-                for possible_operator in self.possible_operators:
-                    expressions.append(
-                        Operation(
-                            left=expression,
-                            right=Constant(constant),
-                            operator=possible_operator,
-                        )
-                    )
-
-        return any(expression.evaluate() == self.result for expression in expressions)
+        # Assumes positive inputs, like the puzzle's
+        if all(
+            definition.inverse is not None for definition in self.possible_operators
+        ):
+            return self.can_be_solved_backwards()
+
+        return self.can_be_solved_forwards()
+
+    def can_be_solved_backwards(self) -> bool:
+        # A branch stops as soon as an operator cannot be undone
+        inverses = [
+            definition.inverse
+            for definition in self.possible_operators
+            if definition.inverse is not None
+        ]
+        # The first input is the smallest any value on the way can be
+        lowest_target = (
+            self.inputs[0]
+            if all(definition.non_decreasing for definition in self.possible_operators)
+            else None
+        )
+        targets = [(self.result, len(self.inputs) - 1)]
+        while len(targets) > 0:
+            target, i = targets.pop()
+            if i == 0:
+                if target == self.inputs[0]:
+                    return True
+                continue
+
+            for inverse in inverses:
+                left = inverse(target, self.inputs[i])
+                if left is not None and (
+                    lowest_target is None or left >= lowest_target
+                ):
+                    targets.append((left, i - 1))
+
+        return False
+
+    def can_be_solved_forwards(self) -> bool:
+        operators = [definition.apply for definition in self.possible_operators]
+        can_prune = all(
+            definition.non_decreasing for definition in self.possible_operators
+        )
+        values = [(self.inputs[0], 1)]
+        while len(values) > 0:
+            value, i = values.pop()
+            if can_prune and value > self.result:
+                continue
+            if i == len(self.inputs):
+                if value == self.result:
+                    return True
+                continue
+
+            for apply in operators:
+                values.append((apply(value, self.inputs[i]), i + 1))
+
+        return False
+
+
+def decimal_shift(right: int) -> int:
+    shift = 10
+    while shift <= right:
+        shift *= 10
+
+    return shift
 
 
 def concat(left: int, right: int) -> int:
-    return int(str(left) + str(right))
+    return left * decimal_shift(right) + right
 
 
-def main() -> None:
-    input_lines = Path("input/input.txt").read_text("utf-8").strip().split("\n")
+def unadd(result: int, right: int) -> Optional[int]:
+    return result - right if result >= right else None
 
-    equations = [
-        Equation.from_str(equation_str, [operator.add, operator.mul])
-        for equation_str in input_lines
-    ]
-    print(sum(equation.result for equation in equations if equation.can_be_made_true()))
 
+def unmul(result: int, right: int) -> Optional[int]:
+    return result // right if right != 0 and result % right == 0 else None
+
+
+def unconcat(result: int, right: int) -> Optional[int]:
+    shift = decimal_shift(right)
+    return result // shift if result % shift == right else None
+
+
+ADD = register_operator(OperatorDefinition("+", operator.add, unadd, True))
+MUL = register_operator(OperatorDefinition("*", operator.mul, unmul, True))
+CONCAT = register_operator(OperatorDefinition("||", concat, unconcat, True))
+
+
+def parse_equations(input_path: Path) -> IntArrays:
+    results, inputs, input_ends = array("q"), array("q"), array("q")
+    for equation_str in iter_lines(input_path):
+        equation = Equation.from_str(equation_str, [])
+        results.append(equation.result)
+        inputs.extend(equation.inputs)
+        input_ends.append(len(inputs))
+
+    return {"results": results, "inputs": inputs, "input_ends": input_ends}
+
+
+def parse(input_path: Path) -> list[Equation]:
+    arrays = load_parsed(input_path, parse_equations)
+    inputs = arrays["inputs"]
+
+    equations = []
+    input_start = 0
+    for result, input_end in zip(arrays["results"], arrays["input_ends"]):
+        equations.append(
+            Equation(
+                result,
+                inputs[input_start:input_end].tolist(),
+                [ADD, MUL],
+            )
+        )
+        input_start = input_end
+
+    return equations
+
+
+def part1(equations: list[Equation]) -> int:
+    return sum(equation.result for equation in equations if equation.can_be_made_true())
+
+
+def part2(equations: list[Equation]) -> int:
     equations_with_concat = [
-        Equation.from_str(equation_str, [operator.add, operator.mul, concat])
-        for equation_str in input_lines
+        replace(equation, possible_operators=[ADD, MUL, CONCAT])
+        for equation in equations
     ]
-    print(
-        sum(
-            equation.result
-            for equation in equations_with_concat
-            if equation.can_be_made_true()
-        )
+
+    return sum(
+        equation.result
+        for equation in equations_with_concat
+        if equation.can_be_made_true()
     )
 
 
+def main(input_path: Path = INPUT_PATH) -> None:
+    equations = parse(input_path)
+    print(part1(equations))
+    print(part2(equations))
+
+
 if __name__ == "__main__":
-    main()
+    run_solution(main, parse, [part1, part2], INPUT_PATH)
@@ -0,0 +1,50 @@
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Optional
+
+from day7.main import ADD, CONCAT, INPUT_PATH, MUL, Equation, parse, part1
+from utils.cli import run_solution
+from utils.pool import BatchResult, map_batches
+
+
+@dataclass
+class Evaluation:
+    total: int
+    total_with_concat: int
+    # Only the equations that cannot be made true without concatenation are chunked
+    chunks: list[BatchResult[int]]
+
+
+def evaluate(equations: list[Equation], jobs: Optional[int] = None) -> Evaluation:
+    total = 0
+    failed = []
+    for equation in equations:
+        if replace(equation, possible_operators=[ADD, MUL]).can_be_made_true():
+            total += equation.result
+        else:
+            failed.append(replace(equation, possible_operators=[ADD, MUL, CONCAT]))
+
+    if len(failed) == 0:
+        return Evaluation(total, total, [])
+
+    chunks = map_batches(part1, failed, jobs)
+    return Evaluation(total, total + sum(chunk.result for chunk in chunks), chunks)
+
+
+def part2(equations: list[Equation]) -> int:
+    return evaluate(equations).total_with_concat
+
+
+def main(input_path: Path = INPUT_PATH) -> None:
+    evaluation = evaluate(parse(input_path))
+    print(evaluation.total)
+    print(evaluation.total_with_concat)
+    for i, chunk in enumerate(evaluation.chunks):
+        print(
+            f"  chunk {i}: {chunk.items} equations in {chunk.seconds:.4f}s"
+            f" on worker {chunk.worker}"
+        )
+
+
+if __name__ == "__main__":
+    run_solution(main, parse, [part1, part2], INPUT_PATH)
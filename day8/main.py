@@ -2,7 +2,13 @@ from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 
-Coord = tuple[int, int]
+from utils.cli import run_solution
+from utils.grid import Coord, Grid
+from utils.io import read_text
+
+INPUT_PATH = Path(__file__).parent / "input" / "input.txt"
+
+EMPTY = ord(".")
 
 
 def add(coord1: Coord, coord2: Coord) -> Coord:
@@ -21,27 +27,23 @@ def subtract(minuend: Coord, subtrahend: Coord) -> Coord:
 
 @dataclass
 class AntennaMap:
-    height: int
-    width: int
-    antenna_locations: dict[str, set[Coord]]
+    grid: Grid
+    antenna_locations: dict[str, list[Coord]]
 
     @staticmethod
     def from_str(map_str: str) -> "AntennaMap":
-        rows = map_str.split("\n")
-        height = len(rows)
-        width = len(rows[0])
-        antenna_locations = defaultdict(set)
-        for x in range(width):
-            for y in range(height):
-                if rows[y][x] == ".":
-                    continue
+        grid = Grid.from_str(map_str)
+        antenna_locations = defaultdict(list)
+        for index, cell in enumerate(grid.cells):
+            if cell == EMPTY:
+                continue
 
-                antenna_locations[rows[y][x]].add((x, y))
+            antenna_locations[chr(cell)].append(grid.coord(index))
 
-        return AntennaMap(height, width, antenna_locations)
+        return AntennaMap(grid, antenna_locations)
 
     def count_antinodes(self) -> int:
-        antinodes = set()
+        antinodes = bytearray(len(self.grid))
         for coords in self.antenna_locations.values():
             for coord1 in coords:
                 for coord2 in coords:
@@ -51,16 +53,16 @@ class AntennaMap:
                     coord_diff = subtract(coord2, coord1)
                     antinode1 = subtract(coord1, coord_diff)
                     if self.is_in_map(antinode1):
-                        antinodes.add(antinode1)
+                        antinodes[self.grid.index(*antinode1)] = 1
 
                     antinode2 = add(coord2, coord_diff)
                     if self.is_in_map(antinode2):
-                        antinodes.add(antinode2)
+                        antinodes[self.grid.index(*antinode2)] = 1
 
-        return len(antinodes)
+        return antinodes.count(1)
 
     def count_antinodes2(self) -> int:
-        antinodes = set()
+        antinodes = bytearray(len(self.grid))
         for coords in self.antenna_locations.values():
             for coord1 in coords:
                 for coord2 in coords:
@@ -70,35 +72,44 @@ class AntennaMap:
                     coord_diff = subtract(coord2, coord1)
                     antinode_location = coord2
                     while self.is_in_map(antinode_location):
-                        antinodes.add(antinode_location)
+                        antinodes[self.grid.index(*antinode_location)] = 1
                         antinode_location = add(antinode_location, coord_diff)
 
                     antinode_location = coord1
                     while self.is_in_map(antinode_location):
-                        antinodes.add(antinode_location)
+                        antinodes[self.grid.index(*antinode_location)] = 1
                         antinode_location = subtract(antinode_location, coord_diff)
 
-        return len(antinodes)
+        return antinodes.count(1)
 
     def is_in_map(self, coord: Coord) -> bool:
-        x, y = coord
+        return self.grid.in_bounds(*coord)
+
+
+def parse(input_path: Path) -> AntennaMap:
+    return AntennaMap.from_str(read_text(input_path).strip())
+
+
+def part1(antenna_map: AntennaMap) -> int:
+    return antenna_map.count_antinodes()
+
 
-        return 0 <= x < self.width and 0 <= y < self.height
+def part2(antenna_map: AntennaMap) -> int:
+    return antenna_map.count_antinodes2()
 
 
-def main() -> None:
-    antenna_map_str = Path("input/input.txt").read_text("utf-8").strip()
-    antenna_map = AntennaMap.from_str(antenna_map_str)
+def main(input_path: Path = INPUT_PATH) -> None:
+    antenna_map = parse(input_path)
 
     print(
-        f"{antenna_map.count_antinodes()} unique locations within the bounds of the map"
+        f"{part1(antenna_map)} unique locations within the bounds of the map"
         " contain an antinode"
     )
     print(
-        f"Using the updated model, {antenna_map.count_antinodes2()} unique locations"
+        f"Using the updated model, {part2(antenna_map)} unique locations"
         " within the bounds of the map contain an antinode"
     )
 
 
 if __name__ == "__main__":
-    main()
+    run_solution(main, parse, [part1, part2], INPUT_PATH)
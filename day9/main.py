@@ -1,8 +1,14 @@
+from array import array
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 
+from utils.cli import run_solution
 from utils.helpers import expect
+from utils.io import read_text
+from utils.parse_cache import IntArrays, load_parsed
+
+INPUT_PATH = Path(__file__).parent / "input" / "input.txt"
 
 
 @dataclass
@@ -29,8 +35,12 @@ class Disk:
 
     @staticmethod
     def from_disk_map(disk_map: str) -> "Disk":
+        return Disk.from_sizes([int(c) for c in disk_map])
+
+    @staticmethod
+    def from_sizes(sizes: Sequence[int]) -> "Disk":
         blocks = []
-        for i, size in enumerate(int(c) for c in disk_map):
+        for i, size in enumerate(sizes):
             if i % 2 == 0:
                 blocks.append(Block.file(file_id=i // 2, size=size))
             else:
@@ -133,17 +143,31 @@ class Disk:
             j -= 1
 
 
-def main() -> None:
-    disk_map = Path("input/input.txt").read_text("utf-8").strip()
+def parse_sizes(input_path: Path) -> IntArrays:
+    return {"sizes": array("b", [int(c) for c in read_text(input_path).strip()])}
+
+
+def parse(input_path: Path) -> Sequence[int]:
+    return load_parsed(input_path, parse_sizes)["sizes"]
 
-    disk = Disk.from_disk_map(disk_map)
+
+def part1(sizes: Sequence[int]) -> int:
+    disk = Disk.from_sizes(sizes)
     disk.compact()
-    print(disk.checksum())
+    return disk.checksum()
+
+
+def part2(sizes: Sequence[int]) -> int:
+    disk = Disk.from_sizes(sizes)
+    disk.compact2()
+    return disk.checksum()
+
 
-    disk2 = Disk.from_disk_map(disk_map)
-    disk2.compact2()
-    print(disk2.checksum())
+def main(input_path: Path = INPUT_PATH) -> None:
+    sizes = parse(input_path)
+    print(part1(sizes))
+    print(part2(sizes))
 
 
 if __name__ == "__main__":
-    main()
+    run_solution(main, parse, [part1, part2], INPUT_PATH)
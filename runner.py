@@ -0,0 +1,130 @@
+import argparse
+import importlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from utils.cache import DEFAULT_MAX_CACHE_SIZE, AnswerCache, answer_keys
+from utils.helpers import expect
+
+PROJECT_ROOT = Path(__file__).parent.resolve()
+
+
+@dataclass(frozen=True)
+class DayResult:
+    day: int
+    answers: tuple[int, int]
+    cached: tuple[bool, bool]
+    wall_time: float
+    cpu_time: float
+
+    def __str__(self) -> str:
+        part1, part2 = (
+            f"{answer} (cached)" if cached else str(answer)
+            for answer, cached in zip(self.answers, self.cached)
+        )
+        return (
+            f"Day {self.day:>2}: {part1} | {part2}"
+            f" (wall {self.wall_time:.3f}s, cpu {self.cpu_time:.3f}s)"
+        )
+
+
+def available_days() -> list[int]:
+    return sorted(
+        int(day_directory.name[len("day") :])
+        for day_directory in PROJECT_ROOT.glob("day*")
+        if (day_directory / "main.py").exists()
+    )
+
+
+def parse_days(days_spec: str) -> list[int]:
+    days: set[int] = set()
+    for part in days_spec.split(","):
+        first, _, last = part.partition("-")
+        days.update(range(int(first), int(last or first) + 1))
+
+    return sorted(days)
+
+
+def run_day(day: int, cache: Optional[AnswerCache]) -> DayResult:
+    solution = importlib.import_module(f"day{day}.main")
+    parts = [solution.part1, solution.part2]
+
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    keys: list[str] = []
+    answers: list[Optional[int]] = [None] * len(parts)
+    if cache is not None:
+        keys = answer_keys(
+            Path(expect(solution.__file__)), solution.INPUT_PATH, len(parts)
+        )
+        answers = [cache.get(key) for key in keys]
+    cached = tuple(answer is not None for answer in answers)
+
+    if not all(cached):
+        parsed = solution.parse(solution.INPUT_PATH)
+        for i, part in enumerate(parts):
+            if answers[i] is None:
+                answer = part(parsed)
+                answers[i] = answer
+                if cache is not None:
+                    cache.put(keys[i], answer)
+
+    return DayResult(
+        day,
+        (expect(answers[0]), expect(answers[1])),
+        (cached[0], cached[1]),
+        wall_time=time.perf_counter() - wall_start,
+        cpu_time=time.process_time() - cpu_start,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run every day's solution in parallel")
+    parser.add_argument(
+        "--days",
+        type=parse_days,
+        default=available_days(),
+        help="days to run, e.g. 1-15 or 1,3,5-7 (default: every day)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="always recompute answers instead of reusing cached ones",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_MAX_CACHE_SIZE,
+        help="bytes of answers to keep before evicting the least recently used",
+    )
+    args = parser.parse_args()
+    cache = None if args.no_cache else AnswerCache(max_size=args.cache_size)
+
+    wall_start = time.perf_counter()
+    failed = False
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        day_futures = {executor.submit(run_day, day, cache): day for day in args.days}
+        for future in as_completed(day_futures):
+            try:
+                print(future.result(), flush=True)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                failed = True
+                print(f"Day {day_futures[future]:>2}: failed with {e!r}", flush=True)
+
+    print(f"Ran {len(args.days)} days in {time.perf_counter() - wall_start:.2f}s")
+
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
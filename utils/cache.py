@@ -0,0 +1,75 @@
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+UTILS_DIRECTORY = Path(__file__).parent
+DEFAULT_CACHE_DIRECTORY = UTILS_DIRECTORY.parent / ".cache" / "answers"
+DEFAULT_MAX_CACHE_SIZE = 64 * 1024 * 1024
+
+
+def file_sha256(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def source_sha256(solution_path: Path) -> str:
+    # The solution can import any module of its day, such as day4/word_search.py
+    digest = hashlib.sha256()
+    for source_path in [
+        *sorted(solution_path.parent.glob("*.py")),
+        *sorted(UTILS_DIRECTORY.glob("*.py")),
+    ]:
+        digest.update(source_path.read_bytes())
+    return digest.hexdigest()
+
+
+def answer_keys(solution_path: Path, input_path: Path, parts: int) -> list[str]:
+    prefix = f"{file_sha256(input_path)}-{source_sha256(solution_path)}"
+    return [f"{prefix}-part{part}" for part in range(1, parts + 1)]
+
+
+@dataclass
+class AnswerCache:
+    # Evicts the least recently used answers once they take more than max_size bytes
+
+    directory: Path = DEFAULT_CACHE_DIRECTORY
+    max_size: int = DEFAULT_MAX_CACHE_SIZE
+
+    def get(self, key: str) -> Optional[int]:
+        path = self.directory / f"{key}.json"
+        try:
+            answer = json.loads(path.read_text("utf-8"))
+            os.utime(path)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        return answer
+
+    def put(self, key: str, answer: int) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{key}.json"
+        partial_path = path.with_name(f"{path.name}.{os.getpid()}.partial")
+        partial_path.write_text(json.dumps(answer), "utf-8")
+        partial_path.replace(path)
+
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+
+            path.unlink(missing_ok=True)
+            total_size -= size
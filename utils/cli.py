@@ -0,0 +1,76 @@
+import argparse
+import functools
+import inspect
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+from utils.profiling import profile_solution
+
+DEFAULT_PROFILE_DIRECTORY = Path("profile")
+
+
+@dataclass(frozen=True)
+class Option:
+    # Passed to both main and parse as a keyword argument of the same name
+    name: str
+    type: Callable[[str], Any]
+    default: Any
+    help: str
+
+
+def run_solution(
+    main: Callable[..., None],
+    parse: Callable[..., Any],
+    parts: list[Callable[[Any], Any]],
+    default_input_path: Path,
+    options: Sequence[Option] = (),
+) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "input_path",
+        nargs="?",
+        type=Path,
+        default=default_input_path,
+        help='the puzzle input, or "-" for stdin (default: input/input.txt)',
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="profile parsing and each part separately instead of printing the answers",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        type=Path,
+        default=DEFAULT_PROFILE_DIRECTORY,
+        help="where to write .pstats and .collapsed files (default: ./profile)",
+    )
+    parser.add_argument(
+        "--top", type=int, default=15, help="hot functions to print for each part"
+    )
+    for option in options:
+        parser.add_argument(
+            f"--{option.name.replace('_', '-')}",
+            type=option.type,
+            default=option.default,
+            help=f"{option.help} (default: {option.default})",
+        )
+    args = parser.parse_args()
+    option_values = {option.name: getattr(args, option.name) for option in options}
+
+    if not args.profile:
+        main(args.input_path, **option_values)
+        return
+
+    # Named after the engine, such as day3.streaming, so that engines can be compared
+    solution_path = Path(inspect.getfile(main))
+    output_prefix = (
+        args.profile_dir / f"{solution_path.parent.name}.{solution_path.stem}"
+    )
+    profile_solution(
+        functools.partial(parse, **option_values),
+        parts,
+        args.input_path,
+        output_prefix,
+        args.top,
+    )
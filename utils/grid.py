@@ -0,0 +1,163 @@
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Iterator, Optional
+
+Coord = tuple[int, int]
+
+ORTHOGONAL_DIRECTIONS: list[Coord] = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+DIAGONAL_DIRECTIONS: list[Coord] = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+ALL_DIRECTIONS: list[Coord] = ORTHOGONAL_DIRECTIONS + DIAGONAL_DIRECTIONS
+
+
+def _allowed_directions_mask(position: int, size: int, axis: int) -> int:
+    mask = 0
+    for bit, direction in enumerate(ALL_DIRECTIONS):
+        if 0 <= position + direction[axis] < size:
+            mask |= 1 << bit
+    return mask
+
+
+def _axis_masks(size: int, axis: int) -> list[int]:
+    # Only the first and last positions differ from the rest
+    if size == 1:
+        return [_allowed_directions_mask(0, size, axis)]
+
+    first, middle, last = (
+        _allowed_directions_mask(position, size, axis) for position in (0, 1, size - 1)
+    )
+    return [first] + [middle] * (size - 2) + [last]
+
+
+@dataclass
+class Grid:
+    # Cells are addressed by index y * width + x
+    width: int
+    height: int
+    cells: bytearray
+    neighbour_offsets: list[int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.neighbour_offsets = [self.offset(dx, dy) for dx, dy in ALL_DIRECTIONS]
+
+    @staticmethod
+    def from_str(grid_str: str) -> "Grid":
+        rows = grid_str.strip().split("\n")
+        return Grid.from_rows(rows)
+
+    @staticmethod
+    def from_rows(rows: list[str]) -> "Grid":
+        width = len(rows[0])
+        if any(len(row) != width for row in rows):
+            raise ValueError("All rows of a grid must have the same width")
+
+        return Grid(width, len(rows), bytearray("".join(rows), "ascii"))
+
+    def __str__(self) -> str:
+        return "\n".join(
+            self.row(y).tobytes().decode("ascii") for y in range(self.height)
+        )
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        self.cells[index] = value
+
+    def copy(self) -> "Grid":
+        return Grid(self.width, self.height, self.cells.copy())
+
+    def char(self, index: int) -> str:
+        return chr(self.cells[index])
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def coord(self, index: int) -> Coord:
+        y, x = divmod(index, self.width)
+        return x, y
+
+    def offset(self, dx: int, dy: int) -> int:
+        return dy * self.width + dx
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def row(self, y: int) -> memoryview:
+        return memoryview(self.cells)[y * self.width : (y + 1) * self.width]
+
+    @cached_property
+    def bounds_masks(self) -> bytes:
+        # Per cell, a bitmask over ALL_DIRECTIONS of the neighbours inside the grid
+        column_masks = _axis_masks(self.width, 0)
+        row_masks = _axis_masks(self.height, 1)
+        distinct_rows = {
+            row_mask: bytes(column_mask & row_mask for column_mask in column_masks)
+            for row_mask in set(row_masks)
+        }
+        return b"".join(distinct_rows[row_mask] for row_mask in row_masks)
+
+    def neighbours(self, index: int, diagonal: bool = False) -> Iterator[int]:
+        mask = self.bounds_masks[index]
+        for bit in range(8 if diagonal else 4):
+            if mask & (1 << bit):
+                yield index + self.neighbour_offsets[bit]
+
+    def steps_to_edge(self, index: int, dx: int, dy: int) -> int:
+        x, y = self.coord(index)
+        steps = len(self.cells)
+        if dx != 0:
+            steps = min(steps, (self.width - 1 - x if dx > 0 else x) // abs(dx))
+        if dy != 0:
+            steps = min(steps, (self.height - 1 - y if dy > 0 else y) // abs(dy))
+        return steps
+
+    def ray(self, index: int, dx: int, dy: int, length: int) -> Optional[bytes]:
+        if self.steps_to_edge(index, dx, dy) < length - 1:
+            return None
+
+        return self._line(index, self.offset(dx, dy), length)
+
+    def lines(self) -> Iterator[bytes]:
+        for y in range(self.height):
+            yield bytes(self.row(y))
+
+        for x in range(self.width):
+            yield bytes(self.cells[x :: self.width])
+
+        # Diagonals start on the top row or the column they lean away from
+        for x, y in self._diagonal_starts(0):
+            length = min(self.width - x, self.height - y)
+            yield self._line(self.index(x, y), self.width + 1, length)
+
+        for x, y in self._diagonal_starts(self.width - 1):
+            length = min(x + 1, self.height - y)
+            yield self._line(self.index(x, y), self.width - 1, length)
+
+    def _diagonal_starts(self, side_x: int) -> list[Coord]:
+        return [(x, 0) for x in range(self.width)] + [
+            (side_x, y) for y in range(1, self.height)
+        ]
+
+    def _line(self, start: int, step: int, length: int) -> bytes:
+        # A step of 0 only happens on a one column grid, whose diagonals are single cells
+        if length == 1:
+            return bytes(self.cells[start : start + 1])
+
+        end = start + step * length
+        return bytes(self.cells[start : end if end >= 0 else None : step])
+
+    def find(self, char: str) -> int:
+        index = self.cells.find(ord(char))
+        if index == -1:
+            raise ValueError(f"Could not find {char} in the grid")
+        return index
+
+    def find_all(self, char: str) -> Iterator[int]:
+        value = ord(char)
+        index = self.cells.find(value)
+        while index != -1:
+            yield index
+            index = self.cells.find(value, index + 1)
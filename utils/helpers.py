@@ -1,7 +1,13 @@
-from typing import Callable, Optional, TypeVar
+import re
+from array import array
+from typing import Optional, TypeVar
+
+from utils.io import Buffer
 
 T = TypeVar("T")
 
+INT_REGEX = re.compile(rb"-?\d+")
+
 
 def expect(optional: Optional[T]) -> T:
     if optional is None:
@@ -14,29 +20,12 @@ def flatten(list_of_lists: list[list[T]]) -> list[T]:
     return [item for sublist in list_of_lists for item in sublist]
 
 
-def try_parse_value_between_strings(
-    string: str, before: str, after: str, parse: Callable[[str], T]
-) -> Optional[T]:
-    before_idx = string.find(before)
-    if before_idx == -1:
-        return None
-    before_idx += len(before)
-
-    after_idx = string[before_idx:].find(after)
-    if after_idx == -1:
-        return None
-
-    return parse(string[before_idx : before_idx + after_idx])
-
-
-def parse_value_between_strings(
-    string: str, before: str, after: str, parse: Callable[[str], T]
-) -> T:
-    maybe_value_between_strings = try_parse_value_between_strings(
-        string, before, after, parse
-    )
-    assert (
-        maybe_value_between_strings is not None
-    ), f"Could not find {before} or {after} in {string}"
+def extract_ints(buffer: Buffer, columns: int) -> "array[int]":
+    # A flat row-major array of len(values) // columns rows
+    values = array("q", map(int, INT_REGEX.findall(buffer)))
+    if len(values) % columns != 0:
+        raise ValueError(
+            f"Found {len(values)} integers, which do not split into rows of {columns}"
+        )
 
-    return maybe_value_between_strings
+    return values
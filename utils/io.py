@@ -0,0 +1,67 @@
+import mmap
+import sys
+from pathlib import Path
+from typing import Iterator, Union
+
+STDIN = Path("-")
+
+Buffer = Union[bytes, mmap.mmap]
+
+
+def read_text(input_path: Path) -> str:
+    if input_path == STDIN:
+        return sys.stdin.read()
+
+    return input_path.read_text("utf-8")
+
+
+def read_mapped(input_path: Path) -> Buffer:
+    if input_path == STDIN:
+        # Stdin cannot be mapped, so it is read in full
+        return sys.stdin.buffer.read()
+
+    with input_path.open("rb") as f:
+        if f.seek(0, 2) == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def iter_chunks(input_path: Path, chunk_size: int) -> Iterator[bytes]:
+    if input_path == STDIN:
+        yield from iter(lambda: sys.stdin.buffer.read(chunk_size), b"")
+        return
+
+    with input_path.open("rb") as f:
+        yield from iter(lambda: f.read(chunk_size), b"")
+
+
+def _iter_raw_lines(input_path: Path) -> Iterator[str]:
+    if input_path == STDIN:
+        yield from sys.stdin
+        return
+
+    with input_path.open("r", encoding="utf-8") as f:
+        yield from f
+
+
+def iter_lines(input_path: Path) -> Iterator[str]:
+    for line in _iter_raw_lines(input_path):
+        line = line.rstrip("\r\n")
+        if line != "":
+            yield line
+
+
+def iter_sections(input_path: Path) -> Iterator[list[str]]:
+    section: list[str] = []
+    for line in _iter_raw_lines(input_path):
+        line = line.rstrip("\r\n")
+        if line != "":
+            section.append(line)
+            continue
+
+        if len(section) > 0:
+            yield section
+            section = []
+
+    if len(section) > 0:
+        yield section
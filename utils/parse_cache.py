@@ -0,0 +1,110 @@
+import inspect
+import json
+import mmap
+import os
+import sys
+from array import array
+from pathlib import Path
+from typing import Callable
+
+from utils.cache import file_sha256, source_sha256
+from utils.io import STDIN
+
+MAGIC = b"PARSED1\n"
+ALIGNMENT = 8
+
+IntArrays = dict[str, "array[int]"]
+IntViews = dict[str, memoryview]
+ArrayParser = Callable[[Path], IntArrays]
+
+
+def _cache_path(input_path: Path, parse_arrays: ArrayParser) -> Path:
+    # Keyed by the sources of the parser's day and utils too, which the parser may call
+    source_hash = source_sha256(Path(inspect.getfile(parse_arrays)))
+    key = f"{file_sha256(input_path)[:16]}{source_hash[:16]}"
+    return input_path.with_name(
+        f".{input_path.name}.{parse_arrays.__name__}.{key}.parsed"
+    )
+
+
+def _write(cache_path: Path, arrays: IntArrays) -> None:
+    offsets = {}
+    offset = 0
+    for name, values in arrays.items():
+        offsets[name] = offset
+        offset += -(-len(values) * values.itemsize // ALIGNMENT) * ALIGNMENT
+
+    header = {
+        "byteorder": sys.byteorder,
+        "arrays": {
+            name: {
+                "typecode": values.typecode,
+                "offset": offsets[name],
+                "length": len(values),
+            }
+            for name, values in arrays.items()
+        },
+    }
+    raw_header = json.dumps(header).encode()
+    data_start = -(-(len(MAGIC) + 8 + len(raw_header)) // ALIGNMENT) * ALIGNMENT
+
+    partial_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.partial")
+    with partial_path.open("wb") as f:
+        f.write(MAGIC)
+        f.write(data_start.to_bytes(8, "little"))
+        f.write(raw_header)
+        for name, values in arrays.items():
+            f.seek(data_start + offsets[name])
+            values.tofile(f)
+    partial_path.replace(cache_path)
+
+
+def _load(cache_path: Path) -> IntViews:
+    with cache_path.open("rb") as f:
+        buffer = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    if buffer[: len(MAGIC)] != MAGIC:
+        raise ValueError(f"{cache_path} is not a parsed input cache")
+
+    data_start = int.from_bytes(buffer[len(MAGIC) : len(MAGIC) + 8], "little")
+    header = json.loads(bytes(buffer[len(MAGIC) + 8 : data_start]).rstrip(b"\0"))
+    if header["byteorder"] != sys.byteorder:
+        raise ValueError(f"{cache_path} was written with a different byte order")
+
+    views = {}
+    for name, layout in header["arrays"].items():
+        start = data_start + layout["offset"]
+        itemsize = array(layout["typecode"]).itemsize
+        views[name] = buffer[start : start + layout["length"] * itemsize].cast(
+            layout["typecode"]
+        )
+    return views
+
+
+def load_parsed(input_path: Path, parse_arrays: ArrayParser) -> IntViews:
+    if input_path == STDIN:
+        return {
+            name: memoryview(values)
+            for name, values in parse_arrays(input_path).items()
+        }
+
+    cache_path = _cache_path(input_path, parse_arrays)
+    if cache_path.exists():
+        try:
+            return _load(cache_path)
+        except ValueError:
+            pass
+
+    for stale_path in input_path.parent.glob(
+        f".{input_path.name}.{parse_arrays.__name__}.*.parsed"
+    ):
+        stale_path.unlink(missing_ok=True)
+
+    arrays = parse_arrays(input_path)
+    try:
+        _write(cache_path, arrays)
+    except OSError:
+        # A read-only input directory only means that the next run parses again
+        return {name: memoryview(values) for name, values in arrays.items()}
+
+    return _load(cache_path)
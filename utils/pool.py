@@ -0,0 +1,56 @@
+import functools
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Batches handed out per worker, so that workers that finish early can take more
+BATCHES_PER_WORKER = 4
+
+
+@dataclass
+class BatchResult(Generic[R]):
+    worker: int
+    items: int
+    result: R
+    seconds: float
+
+
+def run_batch(check: Callable[[list[T]], R], items: list[T]) -> BatchResult[R]:
+    start = time.perf_counter()
+    result = check(items)
+    return BatchResult(os.getpid(), len(items), result, time.perf_counter() - start)
+
+
+def map_batches(
+    check: Callable[[list[T]], R],
+    items: list[T],
+    jobs: Optional[int] = None,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: tuple[Any, ...] = (),
+) -> list[BatchResult[R]]:
+    jobs = jobs or os.cpu_count() or 1
+    batch_size = max(1, -(-len(items) // (jobs * BATCHES_PER_WORKER)))
+    batches = [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=initializer, initargs=initargs
+    ) as executor:
+        return list(executor.map(functools.partial(run_batch, check), batches))
+
+
+def worker_throughputs(batches: list[BatchResult[R]]) -> dict[int, float]:
+    items: dict[int, int] = defaultdict(int)
+    seconds: dict[int, float] = defaultdict(float)
+    for batch in batches:
+        items[batch.worker] += batch.items
+        seconds[batch.worker] += batch.seconds
+
+    return {
+        worker: items[worker] / seconds[worker] if seconds[worker] > 0 else 0.0
+        for worker in items
+    }
@@ -0,0 +1,126 @@
+import cProfile
+import pstats
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+# (file, line, function name) as used by pstats
+Function = tuple[str, int, str]
+
+PROFILER_DISABLE: Function = (
+    "~",
+    0,
+    "<method 'disable' of '_lsprof.Profiler' objects>",
+)
+
+
+@dataclass
+class StepProfile:
+    name: str
+    result: Any
+    wall_time: float
+    peak_memory: int
+    stats: pstats.Stats
+
+
+def profile_step(name: str, func: Callable[..., Any], *args: Any) -> StepProfile:
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        result = func(*args)
+    finally:
+        profiler.disable()
+        wall_time = time.perf_counter() - start
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return StepProfile(name, result, wall_time, peak_memory, pstats.Stats(profiler))
+
+
+def describe_function(function: Function) -> str:
+    file, line, name = function
+    if file == "~":
+        return name
+
+    return f"{Path(file).parent.name}/{Path(file).name}:{line}({name})"
+
+
+def collapsed_stacks(stats: pstats.Stats) -> dict[str, float]:
+    # cProfile only records caller/callee pairs, so shared time is split between callers
+    raw_stats: dict[Function, Any] = stats.stats  # type: ignore[attr-defined]
+    callees: dict[Function, dict[Function, float]] = {}
+    for function, (_, _, _, _, callers) in raw_stats.items():
+        for caller, (_, _, _, caller_cumulative_time) in callers.items():
+            callees.setdefault(caller, {})[function] = caller_cumulative_time
+
+    stacks: dict[str, float] = {}
+
+    def visit(function: Function, path: list[Function], seconds: float) -> None:
+        _, _, own_time, cumulative_time, _ = raw_stats[function]
+        if cumulative_time <= 0:
+            return
+
+        share = seconds / cumulative_time
+        stack = ";".join(describe_function(f) for f in path + [function])
+        stacks[stack] = stacks.get(stack, 0.0) + own_time * share
+
+        for callee, callee_time in callees.get(function, {}).items():
+            if callee not in path and callee != function:
+                visit(callee, path + [function], callee_time * share)
+
+    for function, (_, _, _, cumulative_time, callers) in raw_stats.items():
+        if len(callers) == 0 and function != PROFILER_DISABLE:
+            visit(function, [], cumulative_time)
+
+    return stacks
+
+
+def write_profile(profile: StepProfile, output_prefix: Path) -> None:
+    output_prefix.parent.mkdir(parents=True, exist_ok=True)
+    profile.stats.dump_stats(f"{output_prefix}.pstats")
+
+    with open(f"{output_prefix}.collapsed", "w", encoding="utf-8") as f:
+        for stack, seconds in sorted(collapsed_stacks(profile.stats).items()):
+            microseconds = round(seconds * 1_000_000)
+            if microseconds > 0:
+                f.write(f"{stack} {microseconds}\n")
+
+
+def print_profile(profile: StepProfile, top: int) -> None:
+    print(
+        f"{profile.name}: {profile.result!r:.60} in {profile.wall_time:.3f}s,"
+        f" peak memory {profile.peak_memory / 1024 / 1024:.1f}MiB"
+    )
+
+    raw_stats: dict[Function, Any] = profile.stats.stats  # type: ignore[attr-defined]
+    hottest = sorted(raw_stats.items(), key=lambda item: item[1][2], reverse=True)
+    print(f"  {'own':>9} {'cumulative':>11} {'calls':>11}  function")
+    for function, (_, calls, own_time, cumulative_time, _) in hottest[:top]:
+        print(
+            f"  {own_time:8.3f}s {cumulative_time:10.3f}s {calls:>11}"
+            f"  {describe_function(function)}"
+        )
+
+
+def profile_solution(
+    parse: Callable[[Path], Any],
+    parts: list[Callable[[Any], Any]],
+    input_path: Path,
+    output_prefix: Path,
+    top: int,
+) -> None:
+    parse_profile = profile_step("parse", parse, input_path)
+    profiles = [parse_profile] + [
+        profile_step(f"part{i}", part, parse_profile.result)
+        for i, part in enumerate(parts, start=1)
+    ]
+
+    for profile in profiles:
+        print_profile(profile, top)
+        write_profile(profile, Path(f"{output_prefix}-{profile.name}"))
+
+    print(f"Wrote .pstats and .collapsed files to {output_prefix.parent}")